@@ -0,0 +1,6 @@
+"""Allow running GitCLI with `python -m gitcli` (also the entry point for native builds)"""
+
+from gitcli.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -1,140 +1,131 @@
 #!/usr/bin/env python3
 import os
 import sys
-import readline
-import platform
+import bisect
+import importlib
 from colorama import Fore, Style, init
-from yaspin import yaspin
-
-# Import modules
-from .helpers import run_command, get_current_branch, get_repo_name
-from .git_operations import (
-    commit_changes, push_changes, pull_changes, stage_changes,
-    show_status, show_log, show_diff, show_diff_staged,
-    sync_changes, fetch_changes, clone_repository, quick_push
-)
-from .git_branches import (
-    switch_branch, add_branch, delete_branch, rename_branch, list_branches
-)
-from .git_advanced import manage_remotes, reset_commit, amend_commit
-from .git_hooks import manage_hooks, list_installed_hooks
-from .git_stash import (
-    stash_changes, stash_pop, stash_apply, stash_list, 
-    stash_drop, stash_show
+
+from .helpers import (
+    get_current_branch, get_repo_name, begin_command, is_git_repo, probe_repo, run_spinning,
+    close_session, get_config, save_config
 )
-from .git_conflicts import resolve_conflicts, check_conflicts
-from .git_operations import smart_save
-from .helpers import get_config, save_config
-
-# Initialize colorama
-init(autoreset=True)
-
-# Tab completion
-COMMANDS = [
-    "save", "config", "commit", "push", "pull", "status", "stage", "log", "diff", "diff-staged",
-    "switch-branch", "add-branch", "delete-branch", "rename-branch", "list-branch", 
-    "quick-push", "qp", "sync", "fetch", "clone", "remotes", "reset", 
-    "amend", "hooks", "list-hooks", "stash", "stash-pop", "stash-apply", 
-    "stash-list", "stash-drop", "stash-show", "resolve-conflicts", "check-conflicts",
-    "help", "quit"
-]
+
+def _blank_colors():
+    """Turn every Fore/Style code into an empty string (shared by all modules)."""
+    for codes in (Fore, Style):
+        for name in vars(codes):
+            setattr(codes, name, "")
+
+# Piped output would only have its colors stripped again by colorama; blank
+# them before the templates below are built so nothing needs wrapping
+if not sys.stdout.isatty():
+    _blank_colors()
+
+def _lazy(module, name):
+    """Return a handler that imports `module` the first time it is run.
+
+    A one-shot `gitcli status` then only loads the module it dispatches to.
+    """
+    def handler(*args):
+        return getattr(importlib.import_module(module, __package__), name)(*args)
+    handler.__name__ = name
+    return handler
+
+# Tab completion. readline calls the completer once per state for the same
+# text, so keep the matches from the first call instead of rescanning COMMANDS
+_completion = {"text": None, "matches": ()}
 
 def completer(text, state):
-    matches = [c for c in COMMANDS if c.startswith(text)]
+    if text != _completion["text"]:
+        # Commands are case-insensitive; fall back to substring matches when
+        # nothing starts with the typed text ("branch" -> add-branch, ...)
+        key = text.lower()
+        # COMMANDS is sorted, so prefix matches form one contiguous run
+        start = bisect.bisect_left(COMMANDS, key)
+        end = bisect.bisect_left(COMMANDS, key + "\uffff", start)
+        matches = COMMANDS[start:end]
+        if not matches:
+            matches = tuple(c for c in COMMANDS if key in c)
+        _completion["matches"] = matches
+        _completion["text"] = text
+    matches = _completion["matches"]
     return matches[state] if state < len(matches) else None
 
-readline.set_completer(completer)
-# Cross-platform readline configuration
-if platform.system() == "Windows":
-    readline.parse_and_bind("tab: complete")
-else:
-    readline.parse_and_bind("bind ^I rl_complete")
+def _setup_readline():
+    """Enable tab completion; only the interactive prompt needs readline."""
+    try:
+        import readline
+    except ImportError:  # e.g. Windows without pyreadline3
+        return
+    readline.set_completer(completer)
+    # macOS ships libedit, which uses its own binding syntax
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+
+_RULE = Fore.MAGENTA + Style.BRIGHT + "=" * 60 + Style.RESET_ALL
+
+# Everything but the repo and branch is fixed, so the banner is one template
+_WELCOME_TEMPLATE = "\n".join([
+    "",
+    _RULE,
+    Fore.MAGENTA + Style.BRIGHT + "  🚀 GitCLI - Git Operations Automation" + Style.RESET_ALL,
+    _RULE,
+    Fore.CYAN + "  Repository: " + Fore.WHITE + "{repo}",
+    Fore.CYAN + "  Branch: " + Fore.WHITE + "{branch}",
+    _RULE,
+    Fore.GREEN + "\n🚀 Quick Start:",
+    Fore.CYAN + "  save" + Fore.WHITE + "           - Stage, commit, and push",
+    Fore.CYAN + "  save <message>" + Fore.WHITE + " - Save with commit message",
+    Fore.YELLOW + "\n💡 Type 'help' for all commands | Press Tab for auto-complete\n",
+]) + Style.RESET_ALL + "\n"
 
 def show_welcome():
     """Show welcome screen only once at startup"""
-    repo = get_repo_name()
-    branch = get_current_branch()
-    
-    print("\n" + Fore.MAGENTA + Style.BRIGHT + "=" * 60)
-    print(Fore.MAGENTA + Style.BRIGHT + "  🚀 GitCLI - Git Operations Automation")
-    print(Fore.MAGENTA + Style.BRIGHT + "=" * 60)
-    print(Fore.CYAN + f"  Repository: " + Fore.WHITE + f"{repo}")
-    print(Fore.CYAN + f"  Branch: " + Fore.WHITE + f"{branch}")
-    print(Fore.MAGENTA + Style.BRIGHT + "=" * 60)
-    print(Fore.GREEN + "\n🚀 Quick Start:")
-    print(Fore.CYAN + "  save" + Fore.WHITE + "           - Stage, commit, and push")
-    print(Fore.CYAN + "  save <message>" + Fore.WHITE + " - Save with commit message")
-    print(Fore.YELLOW + "\n💡 Type 'help' for all commands | Press Tab for auto-complete\n")
+    sys.stdout.write(_WELCOME_TEMPLATE.format(repo=get_repo_name(), branch=get_current_branch()))
 
-def show_help():
-    """Display all available commands"""
-    print("\n" + Fore.CYAN + Style.BRIGHT + "📚 GitCLI Commands")
-    print(Fore.CYAN + "=" * 60)
-    
-    print(Fore.MAGENTA + Style.BRIGHT + "\n🚀 Quick Commands")
-    print(Fore.CYAN + "-" * 60)
-    smart_commands = [
+# (heading, [(command, description), ...]) for each block of the help screen
+HELP_SECTIONS = [
+    (Fore.MAGENTA + Style.BRIGHT + "\n🚀 Quick Commands", [
         ("save", "Stage, commit, and push"),
         ("save <message>", "Save with inline commit message"),
         ("config", "Manage GitCLI settings"),
-    ]
-    for cmd, desc in smart_commands:
-        print(Fore.GREEN + f"  {cmd.ljust(20)}" + Fore.WHITE + f"{desc}")
-    
-    print(Fore.YELLOW + Style.BRIGHT + "\n⚙️  Advanced Commands")
-    print(Fore.CYAN + "-" * 60)
-    advanced_commands = [
+    ]),
+    (Fore.YELLOW + Style.BRIGHT + "\n⚙️  Advanced Commands", [
         ("commit", "Commit staged changes"),
         ("push", "Push changes to remote"),
         ("pull", "Pull latest changes"),
+        ("sync", "Pull then push in one step"),
+        ("status", "Show working tree status"),
         ("stage", "Stage changes for commit"),
         ("log", "View commit history"),
         ("diff", "Show unstaged changes"),
         ("diff-staged", "Show staged changes"),
         ("quick-push / qp", "Stage, commit & push in one go"),
-    ]
-    for cmd, desc in advanced_commands:
-        print(Fore.GREEN + f"  {cmd.ljust(20)}" + Fore.WHITE + f"{desc}")
-    
-    print(Fore.YELLOW + Style.BRIGHT + "\n🌿 Branch Management")
-    print(Fore.CYAN + "-" * 60)
-    branch_commands = [
+    ]),
+    (Fore.YELLOW + Style.BRIGHT + "\n🌿 Branch Management", [
         ("switch-branch", "Switch to another branch"),
         ("add-branch", "Create new branch"),
         ("delete-branch", "Delete a branch"),
         ("rename-branch", "Rename a branch"),
         ("list-branch", "List all branches"),
-    ]
-    for cmd, desc in branch_commands:
-        print(Fore.GREEN + f"  {cmd.ljust(20)}" + Fore.WHITE + f"{desc}")
-    
-    print(Fore.YELLOW + Style.BRIGHT + "\n💾 Stash Management")
-    print(Fore.CYAN + "-" * 60)
-    stash_commands = [
+    ]),
+    (Fore.YELLOW + Style.BRIGHT + "\n💾 Stash Management", [
         ("stash", "Stash uncommitted changes"),
         ("stash-pop", "Apply and remove stash"),
         ("stash-apply", "Apply stash (keep it)"),
         ("stash-list", "List all stashes"),
         ("stash-drop", "Remove a stash"),
         ("stash-show", "Show stash contents"),
-    ]
-    for cmd, desc in stash_commands:
-        print(Fore.GREEN + f"  {cmd.ljust(20)}" + Fore.WHITE + f"{desc}")
-    
-    print(Fore.YELLOW + Style.BRIGHT + "\n🔧 Conflict & Hooks")
-    print(Fore.CYAN + "-" * 60)
-    other_commands = [
+    ]),
+    (Fore.YELLOW + Style.BRIGHT + "\n🔧 Conflict & Hooks", [
         ("resolve-conflicts", "Resolve merge conflicts"),
         ("check-conflicts", "Check for conflicts"),
         ("hooks", "Manage Git hooks"),
         ("list-hooks", "List installed hooks"),
-    ]
-    for cmd, desc in other_commands:
-        print(Fore.GREEN + f"  {cmd.ljust(20)}" + Fore.WHITE + f"{desc}")
-    
-    print(Fore.YELLOW + Style.BRIGHT + "\n🛠️  Other")
-    print(Fore.CYAN + "-" * 60)
-    misc_commands = [
+    ]),
+    (Fore.YELLOW + Style.BRIGHT + "\n🛠️  Other", [
         ("fetch", "Fetch updates without merging"),
         ("clone", "Clone a repository"),
         ("remotes", "Manage remote repositories"),
@@ -142,116 +133,91 @@ def show_help():
         ("amend", "Amend last commit"),
         ("help", "Show this help message"),
         ("quit", "Exit GitCLI"),
+    ]),
+]
+
+def _render_help():
+    # Each line ends with a reset since the screen is written in one go
+    lines = [
+        "\n" + Fore.CYAN + Style.BRIGHT + "📚 GitCLI Commands" + Style.RESET_ALL,
+        Fore.CYAN + "=" * 60,
     ]
-    for cmd, desc in misc_commands:
-        print(Fore.GREEN + f"  {cmd.ljust(20)}" + Fore.WHITE + f"{desc}")
-    
-    print(Fore.CYAN + "\n" + "=" * 60)
-    print(Fore.YELLOW + "💡 Tip: Use 'gitcli save' for quick stage, commit, and push!")
-    print(Fore.CYAN + "=" * 60 + "\n")
+    for heading, commands in HELP_SECTIONS:
+        lines.append(heading + Style.RESET_ALL)
+        lines.append(Fore.CYAN + "-" * 60)
+        lines.extend(
+            Fore.GREEN + f"  {cmd.ljust(20)}" + Fore.WHITE + f"{desc}" for cmd, desc in commands
+        )
+    lines.append(Fore.CYAN + "\n" + "=" * 60)
+    lines.append(Fore.YELLOW + "💡 Tip: Use 'gitcli save' for quick stage, commit, and push!")
+    lines.append(Fore.CYAN + "=" * 60 + "\n")
+    return "\n".join(lines) + Style.RESET_ALL + "\n"
+
+# The help screen is constant, so it is formatted once at import
+_HELP_TEXT = _render_help()
+
+def show_help():
+    """Display all available commands"""
+    sys.stdout.write(_HELP_TEXT)
+
+_PROMPT_TEMPLATE = Fore.MAGENTA + "[%s] " + Fore.CYAN + "> "
+
+_prompt_cache = {"branch": None, "str": ""}
 
 def show_prompt():
     """Show simple prompt with current branch"""
     branch = get_current_branch()
-    return Fore.MAGENTA + f"[{branch}] " + Fore.CYAN + "> "
+    if branch != _prompt_cache["branch"]:
+        _prompt_cache["str"] = _PROMPT_TEMPLATE % branch
+        _prompt_cache["branch"] = branch
+    return _prompt_cache["str"]
+
+# Map common variations to standard commands
+_COMMAND_MAP = {
+    "listbranch": "list-branch",
+    "switchbranch": "switch-branch",
+    "addbranch": "add-branch",
+    "deletebranch": "delete-branch",
+    "renamebranch": "rename-branch",
+    "quickpush": "quick-push",
+    "diffstaged": "diff-staged",
+    "listhooks": "list-hooks",
+    "stashpop": "stash-pop",
+    "stashapply": "stash-apply",
+    "stashlist": "stash-list",
+    "stashdrop": "stash-drop",
+    "stashshow": "stash-show",
+    "resolveconflicts": "resolve-conflicts",
+    "checkconflicts": "check-conflicts",
+}
+
+def _canonicalize(cmd):
+    """Normalize a single command word that has no surrounding whitespace."""
+    cmd = cmd.lower()
+    return _COMMAND_MAP.get(cmd, cmd)
 
 def normalize_command(cmd):
     """Normalize command to handle various formats (listbranch -> list-branch)"""
-    cmd = cmd.strip().lower().replace(" ", "-")
-    
-    # Map common variations to standard commands
-    command_map = {
-        "listbranch": "list-branch",
-        "switchbranch": "switch-branch",
-        "addbranch": "add-branch",
-        "deletebranch": "delete-branch",
-        "renamebranch": "rename-branch",
-        "quickpush": "quick-push",
-        "diffstaged": "diff-staged",
-        "listhooks": "list-hooks",
-        "stashpop": "stash-pop",
-        "stashapply": "stash-apply",
-        "stashlist": "stash-list",
-        "stashdrop": "stash-drop",
-        "stashshow": "stash-show",
-        "resolveconflicts": "resolve-conflicts",
-        "checkconflicts": "check-conflicts",
-    }
-    
-    return command_map.get(cmd, cmd)
+    # sys.argv[1] may contain spaces if it was quoted in the shell
+    return _canonicalize(cmd.strip().replace(" ", "-"))
 
 def execute_command(command, args=None):
     """Execute a single command"""
-    # Smart workflows
-    if command == "save":
-        # Handle inline commit message: gitcli save commit message here
-        commit_msg = " ".join(args) if args else None
-        smart_save(commit_msg)
-    # Original commands
-    elif command == "commit":
-        commit_changes()
-    elif command == "push":
-        push_changes()
-    elif command == "pull":
-        pull_changes()
-    elif command == "fetch":
-        fetch_changes()
-    elif command == "clone":
-        clone_repository()
-    elif command == "stage":
-        stage_changes()
-    elif command == "log":
-        show_log()
-    elif command == "diff":
-        show_diff()
-    elif command == "diff-staged":
-        show_diff_staged()
-    elif command in ["quick-push", "qp"]:
-        quick_push()
-    elif command == "remotes":
-        manage_remotes()
-    elif command == "reset":
-        reset_commit()
-    elif command == "amend":
-        amend_commit()
-    elif command == "hooks":
-        manage_hooks()
-    elif command == "list-hooks":
-        list_installed_hooks()
-    elif command == "stash":
-        stash_changes()
-    elif command == "stash-pop":
-        stash_pop()
-    elif command == "stash-apply":
-        stash_apply()
-    elif command == "stash-list":
-        stash_list()
-    elif command == "stash-drop":
-        stash_drop()
-    elif command == "stash-show":
-        stash_show()
-    elif command == "resolve-conflicts":
-        resolve_conflicts()
-    elif command == "check-conflicts":
-        check_conflicts()
-    elif command == "switch-branch":
-        switch_branch()
-    elif command == "add-branch":
-        add_branch()
-    elif command == "delete-branch":
-        delete_branch()
-    elif command == "rename-branch":
-        rename_branch()
-    elif command == "list-branch":
-        list_branches()
-    elif command == "config":
-        manage_config()
-    elif command == "help":
-        show_help()
-    else:
+    begin_command()
+    handler = DISPATCH.get(command)
+    if handler is None:
         return False
+    if command in _VARIADIC:
+        handler(*(args or ()))
+    else:
+        handler()
     return True
 
+def save_command(*words):
+    """Handle inline commit message: gitcli save commit message here"""
+    from .git_operations import smart_save
+    smart_save(" ".join(words) if words else None)
+
 
 def manage_config():
     """Manage GitCLI configuration"""
@@ -387,7 +353,58 @@ def configure_validation_rules(config):
     save_config(config)
     print(Fore.GREEN + "✅ Validation rules updated!")
 
+# Command name -> handler; "quit" is handled by the REPL loop itself
+DISPATCH = {
+    "save": save_command,
+    "config": manage_config,
+    "commit": _lazy(".git_operations", "commit_changes"),
+    "push": _lazy(".git_operations", "push_changes"),
+    "pull": _lazy(".git_operations", "pull_changes"),
+    "sync": _lazy(".git_operations", "sync_changes"),
+    "fetch": _lazy(".git_operations", "fetch_changes"),
+    "clone": _lazy(".git_operations", "clone_repository"),
+    "status": _lazy(".git_operations", "show_status"),
+    "stage": _lazy(".git_operations", "stage_changes"),
+    "log": _lazy(".git_operations", "show_log"),
+    "diff": _lazy(".git_operations", "show_diff"),
+    "diff-staged": _lazy(".git_operations", "show_diff_staged"),
+    "quick-push": _lazy(".git_operations", "quick_push"),
+    "qp": _lazy(".git_operations", "quick_push"),
+    "remotes": _lazy(".git_advanced", "manage_remotes"),
+    "reset": _lazy(".git_advanced", "reset_commit"),
+    "amend": _lazy(".git_advanced", "amend_commit"),
+    "hooks": _lazy(".git_hooks", "manage_hooks"),
+    "list-hooks": _lazy(".git_hooks", "list_installed_hooks"),
+    "stash": _lazy(".git_stash", "stash_changes"),
+    "stash-pop": _lazy(".git_stash", "stash_pop"),
+    "stash-apply": _lazy(".git_stash", "stash_apply"),
+    "stash-list": _lazy(".git_stash", "stash_list"),
+    "stash-drop": _lazy(".git_stash", "stash_drop"),
+    "stash-show": _lazy(".git_stash", "stash_show"),
+    "resolve-conflicts": _lazy(".git_conflicts", "resolve_conflicts"),
+    "check-conflicts": _lazy(".git_conflicts", "check_conflicts"),
+    "switch-branch": _lazy(".git_branches", "switch_branch"),
+    "add-branch": _lazy(".git_branches", "add_branch"),
+    "delete-branch": _lazy(".git_branches", "delete_branch"),
+    "rename-branch": _lazy(".git_branches", "rename_branch"),
+    "list-branch": _lazy(".git_branches", "list_branches"),
+    "help": show_help,
+}
+
+# One-shot commands that don't need to run inside a repository
+_NO_REPO_OK = frozenset({"clone", "help"})
+
+# Handlers that receive the words typed after the command
+_VARIADIC = frozenset({"save"})
+
+COMMANDS = tuple(sorted([*DISPATCH, "quit"]))
+
 def main():
+    # Initialize colorama here rather than at import, so importing the package
+    # doesn't wrap stdout; piped output has no color codes left to filter
+    if sys.stdout.isatty():
+        init(autoreset=True)
+    
     # Check for command-line arguments
     if len(sys.argv) > 1:
         # Parse command and arguments
@@ -397,7 +414,7 @@ def main():
         # Normalize command (but keep args separate)
         command = normalize_command(raw_command)
         
-        if not os.path.isdir(".git") and command not in ["clone", "help"]:
+        if command not in _NO_REPO_OK and not is_git_repo():
             print(Fore.RED + "❌ Not a git repository.")
             sys.exit(1)
         
@@ -410,7 +427,7 @@ def main():
             sys.exit(1)
     
     # Interactive mode
-    if not os.path.isdir(".git"):
+    if not is_git_repo():
         print(Fore.YELLOW + "⚠️  Not a git repository.")
         print(Fore.CYAN + "Options:")
         print("  1. Initialize git in current directory (git init)")
@@ -422,39 +439,39 @@ def main():
         if choice == "1":
             confirm = input(f"Initialize git in {os.getcwd()}? (y/N): ").lower()
             if confirm == "y":
-                with yaspin(text="Initializing git repository...", color="cyan") as spinner:
-                    result = run_command("git init", capture_output=False)
-                    if result is not None:
-                        spinner.ok("✅")
-                        print(Fore.GREEN + "✅ Git repository initialized!")
-                    else:
-                        spinner.fail("❌")
-                        sys.exit(1)
+                if run_spinning(["git", "init"], "Initializing git repository...") == 0:
+                    probe_repo(refresh=True)
+                    print(Fore.GREEN + "✅ Git repository initialized!")
+                else:
+                    print(Fore.RED + "❌ Failed to initialize git repository.")
+                    sys.exit(1)
             else:
                 print(Fore.CYAN + "🚫 Initialization canceled.")
                 sys.exit(0)
         elif choice == "2":
-            clone_repository()
+            DISPATCH["clone"]()
             sys.exit(0)
         else:
             sys.exit(0)
     
     # Show welcome screen once
+    _setup_readline()
     show_welcome()
     
     while True:
-        user_input = input(show_prompt()).strip()
+        # Split off the command word in one pass; it has no whitespace left,
+        # so only the case and alias need normalizing
+        parts = input(show_prompt()).split(None, 1)
         
-        if not user_input:
+        if not parts:
             continue
         
-        # Parse input
-        parts = user_input.split()
-        command = normalize_command(parts[0])
-        args = parts[1:] if len(parts) > 1 else None
+        command = _canonicalize(parts[0])
+        args = parts[1].split() if len(parts) > 1 else None
         
         if command == "quit":
             print(Fore.CYAN + "👋 Exiting GitCLI...")
+            close_session()
             break
         elif not execute_command(command, args):
             print(Fore.RED + "❌ Unknown command. Type 'help' to see available commands or press Tab for auto-complete.")
@@ -1,7 +1,6 @@
 import os
 from colorama import Fore
-from yaspin import yaspin
-from .helpers import run_command, has_unstaged_changes, has_staged_changes, display_command
+from .helpers import run_command, run_process, repo_state, display_command, spin
 
 def manage_remotes():
     """Manage git remotes"""
@@ -15,7 +14,7 @@ def manage_remotes():
     
     if choice == "1":
         print(Fore.CYAN + "\n📋 Remotes:\n" + "-"*30)
-        display_command("git remote -v")
+        display_command(["git", "remote", "-v"])
     elif choice == "2":
         print(Fore.CYAN + "\n➕ Add Remote")
         name = input("Enter remote name (e.g., origin): ").strip()
@@ -26,11 +25,11 @@ def manage_remotes():
         if not url:
             print(Fore.RED + "❌ Remote URL cannot be empty.")
             return
-        run_command(f"git remote add {name} {url}", capture_output=False)
+        run_command(["git", "remote", "add", name, url], capture_output=False)
         print(Fore.GREEN + f"✅ Remote '{name}' added successfully.")
     elif choice == "3":
         print(Fore.CYAN + "\n➖ Remove Remote")
-        display_command("git remote -v")
+        display_command(["git", "remote", "-v"])
         name = input("\nEnter remote name to remove: ").strip()
         if not name:
             print(Fore.RED + "❌ Remote name cannot be empty.")
@@ -39,11 +38,11 @@ def manage_remotes():
         if confirm != "y":
             print(Fore.CYAN + "🚫 Remove canceled.")
             return
-        run_command(f"git remote remove {name}", capture_output=False)
+        run_command(["git", "remote", "remove", name], capture_output=False)
         print(Fore.GREEN + f"✅ Remote '{name}' removed successfully.")
     elif choice == "4":
         print(Fore.CYAN + "\n🔗 Remote URLs:\n" + "-"*30)
-        display_command("git remote -v")
+        display_command(["git", "remote", "-v"])
     else:
         print(Fore.RED + "❌ Invalid option.")
 
@@ -61,23 +60,28 @@ def reset_commit():
         if confirm != "yes":
             print(Fore.CYAN + "🚫 Reset canceled.")
             return
-        with yaspin(text="Resetting to last commit...", color="yellow") as spinner:
-            run_command("git reset --hard HEAD", capture_output=False)
+        with spin("Resetting to last commit...", "yellow") as spinner:
+            run_command(["git", "reset", "--hard", "HEAD"], capture_output=False)
             spinner.ok("✅")
         print(Fore.GREEN + "✅ Reset to last commit successfully.")
     elif choice == "2":
         print(Fore.CYAN + "\n📜 Recent commits:")
-        display_command("git log --oneline -10")
-        commit_id = input("\nEnter commit ID to reset to: ").strip()
+        log = run_command(["git", "log", "-10", "--format=%h%x09%s"])
+        commits = [line.split("\t", 1) for line in log.splitlines()] if log else []
+        for i, (short, subject) in enumerate(commits, 1):
+            print(f"  {i}. {Fore.YELLOW}{short}{Fore.WHITE} {subject}")
+        commit_id = input(f"\nEnter commit number (1-{len(commits)}) or commit ID to reset to: ").strip()
         if not commit_id:
             print(Fore.RED + "❌ Commit ID cannot be empty.")
             return
+        if commit_id.isdigit() and 1 <= int(commit_id) <= len(commits):
+            commit_id = commits[int(commit_id) - 1][0]
         confirm = input(Fore.RED + f"Are you sure? This will reset to '{commit_id}' and discard all changes after it! (yes/N): ").lower()
         if confirm != "yes":
             print(Fore.CYAN + "🚫 Reset canceled.")
             return
-        with yaspin(text=f"Resetting to commit {commit_id}...", color="yellow") as spinner:
-            result = run_command(f"git reset --hard {commit_id}", capture_output=False)
+        with spin(f"Resetting to commit {commit_id}...", "yellow") as spinner:
+            result = run_command(["git", "reset", "--hard", commit_id], capture_output=False)
             if result is not None:
                 spinner.ok("✅")
                 print(Fore.GREEN + f"✅ Reset to commit '{commit_id}' successfully.")
@@ -88,15 +92,16 @@ def reset_commit():
 
 def amend_commit():
     """Amend the last commit"""
-    # Check if there are any commits
-    result = run_command("git log -1 --oneline")
-    if not result:
+    # One log call both checks that a commit exists and gives the preview
+    last = run_process(["git", "log", "-1", "--format=%h%x09%s"])
+    if last.returncode != 0 or not last.stdout.strip():
         print(Fore.RED + "❌ No commits to amend.")
         return
+    short, _, subject = last.stdout.strip().partition("\t")
     
     print(Fore.CYAN + "\n✏️  Amend Last Commit")
     print(Fore.CYAN + "\nCurrent last commit:")
-    display_command("git log -1 --oneline")
+    print(f"{Fore.YELLOW}{short}{Fore.WHITE} {subject}")
     
     print(Fore.CYAN + "\nAmend options:")
     print("  1. Change commit message only")
@@ -111,39 +116,41 @@ def amend_commit():
         if not message:
             print(Fore.RED + "❌ Commit message cannot be empty.")
             return
-        with yaspin(text="Amending commit...", color="cyan") as spinner:
-            run_command(f'git commit --amend -m "{message}"', capture_output=False)
+        with spin("Amending commit...", "cyan") as spinner:
+            run_command(["git", "commit", "--amend", "-F", "-"], capture_output=False, input=message)
             spinner.ok("✅")
         print(Fore.GREEN + "✅ Commit message updated successfully.")
     elif choice == "2":
-        if not has_unstaged_changes() and not has_staged_changes():
+        state = repo_state()
+        if not state["unstaged"] and not state["staged"]:
             print(Fore.YELLOW + "⚠️  No changes to add to the commit.")
             return
         # Auto-stage changes if needed
-        if has_unstaged_changes():
+        if state["unstaged"]:
             print(Fore.CYAN + "📦 Staging all changes...")
-            run_command("git add .", capture_output=False)
+            run_command(["git", "add", "."], capture_output=False)
             print(Fore.GREEN + "✅ Changes staged.")
-        with yaspin(text="Amending commit...", color="cyan") as spinner:
-            run_command('git commit --amend --no-edit', capture_output=False)
+        with spin("Amending commit...", "cyan") as spinner:
+            run_command(["git", "commit", "--amend", "--no-edit"], capture_output=False)
             spinner.ok("✅")
         print(Fore.GREEN + "✅ Changes added to last commit.")
     elif choice == "3":
-        if not has_unstaged_changes() and not has_staged_changes():
+        state = repo_state()
+        if not state["unstaged"] and not state["staged"]:
             print(Fore.YELLOW + "⚠️  No changes to add to the commit.")
             return
         # Auto-stage changes if needed
-        if has_unstaged_changes():
+        if state["unstaged"]:
             print(Fore.CYAN + "📦 Staging all changes...")
-            run_command("git add .", capture_output=False)
+            run_command(["git", "add", "."], capture_output=False)
             print(Fore.GREEN + "✅ Changes staged.")
         print(Fore.CYAN + "\n📝 Enter new commit message:")
         message = input("> ").strip()
         if not message:
             print(Fore.RED + "❌ Commit message cannot be empty.")
             return
-        with yaspin(text="Amending commit...", color="cyan") as spinner:
-            run_command(f'git commit --amend -m "{message}"', capture_output=False)
+        with spin("Amending commit...", "cyan") as spinner:
+            run_command(["git", "commit", "--amend", "-F", "-"], capture_output=False, input=message)
             spinner.ok("✅")
         print(Fore.GREEN + "✅ Commit amended successfully.")
     else:
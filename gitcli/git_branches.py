@@ -1,19 +1,17 @@
 import os
 from colorama import Fore
-from yaspin import yaspin
-from .helpers import run_command, get_current_branch, sanitize_name, display_command
+from .helpers import run_command, get_current_branch, sanitize_name, display_command, spin, branch_exists
 
 def switch_branch():
     print(Fore.CYAN + "\n🔀 Available branches:")
-    display_command("git branch")
+    display_command(["git", "branch"])
     branch = input("\nEnter branch name to switch to: ").strip()
     if not branch:
         print(Fore.RED + "❌ Branch name cannot be empty.")
         return
     
     # Check if branch exists
-    branches = run_command("git branch --list")
-    if not branches or branch not in branches:
+    if not branch_exists(branch):
         print(Fore.YELLOW + f"⚠️  Branch '{branch}' doesn't exist locally.")
         create = input("Would you like to create it? (y/N): ").lower()
         if create == "y":
@@ -23,8 +21,8 @@ def switch_branch():
             print(Fore.CYAN + "🚫 Switch canceled.")
             return
     
-    with yaspin(text=f"Switching to '{branch}'...", color="cyan") as spinner:
-        result = run_command(f"git checkout {branch}", capture_output=False)
+    with spin(f"Switching to '{branch}'...", "cyan") as spinner:
+        result = run_command(["git", "checkout", branch], capture_output=False)
         if result is not None:
             spinner.ok("✅")
             print(Fore.GREEN + f"✅ Switched to branch '{branch}'")
@@ -41,7 +39,7 @@ def add_branch(branch_name=None):
     if not branch:
         print(Fore.RED + "❌ Branch name cannot be empty.")
         return
-    run_command(f"git checkout -b {branch}", capture_output=False)
+    run_command(["git", "checkout", "-b", branch], capture_output=False)
     print(Fore.GREEN + f"✅ Branch '{branch}' created and switched to it.")
 
 def delete_branch():
@@ -54,6 +52,9 @@ def delete_branch():
     if branch == current:
         print(Fore.RED + "❌ Cannot delete the branch you are currently on.")
         return
+    if not branch_exists(branch):
+        print(Fore.RED + f"❌ Branch '{branch}' doesn't exist.")
+        return
     
     print(Fore.YELLOW + "Delete options:")
     print("  1. Normal delete (safe)")
@@ -66,7 +67,7 @@ def delete_branch():
     if confirm != "y":
         print(Fore.CYAN + "🚫 Delete canceled.")
         return
-    run_command(f"git branch {flag} {branch}", capture_output=False)
+    run_command(["git", "branch", flag, branch], capture_output=False)
     print(Fore.GREEN + f"✅ Branch '{branch}' deleted.")
 
 def rename_branch():
@@ -78,9 +79,9 @@ def rename_branch():
     if not new_name:
         print(Fore.RED + "❌ New branch name cannot be empty.")
         return
-    run_command(f"git branch -m {old_name} {new_name}", capture_output=False)
+    run_command(["git", "branch", "-m", old_name, new_name], capture_output=False)
     print(Fore.GREEN + f"✅ Branch '{old_name}' renamed to '{new_name}'")
 
 def list_branches():
     print(Fore.CYAN + "\n🌿 Branches:\n" + "-"*30)
-    display_command("git branch --all")
+    display_command(["git", "branch", "--all"])
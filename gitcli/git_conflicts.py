@@ -1,77 +1,153 @@
 import os
+import re
+import sys
+import mmap
+import shutil
+import functools
 import subprocess
-import platform
-from colorama import Fore
-from yaspin import yaspin
-from .helpers import run_command, display_command
+from colorama import Fore, Style
+from .helpers import run_command, unmerged_paths, probe_repo, system_name
 
 def has_conflicts():
     """Check if there are merge conflicts"""
-    result = run_command("git diff --name-only --diff-filter=U")
-    return bool(result and result.strip())
+    return bool(get_conflicted_files())
 
 def get_conflicted_files():
     """Get list of files with conflicts"""
-    result = run_command("git diff --name-only --diff-filter=U")
-    if result:
-        return result.strip().split('\n')
-    return []
+    files = unmerged_paths()
+    repo = probe_repo()
+    if not repo or os.path.samefile(repo[1], os.getcwd()):
+        return list(files)
+    # status paths are relative to the top level; make them usable from a
+    # subdirectory both for opening the file and as git pathspecs
+    return [os.path.relpath(os.path.join(repo[1], f)) for f in files]
+
+def _parse_indices(text, count):
+    """Turn "2", "1,3", "5-8" or "all" into zero-based indices below `count`.
+
+    Returns None if any part is invalid or nothing was selected.
+    """
+    if text.strip().lower() == "all":
+        return list(range(count))
+    indices = []
+    for part in text.replace(" ", ",").split(","):
+        if not part:
+            continue
+        first, dash, last = part.partition("-")
+        if not first.isdigit() or (dash and not last.isdigit()):
+            return None
+        lo, hi = int(first), int(last) if dash else int(first)
+        if not 1 <= lo <= hi <= count:
+            return None
+        for i in range(lo - 1, hi):
+            if i not in indices:
+                indices.append(i)
+    return indices or None
+
+def _git(*args, input=None):
+    """Run `git <args>` with output going to the terminal; True on success.
+
+    Goes through run_command (an argv list, no shell) so cached repo state
+    is invalidated after mutating commands.
+    """
+    return run_command(["git", *args], capture_output=False, input=input) is not None
+
+def _batch_git(args, files):
+    """Run one `git <args> -- <files...>` for the whole selection; True on success."""
+    return _git(*args, "--", *files)
+
+# Start of a conflict: "<<<<<<<" at the beginning of a line
+_CONFLICT_START = re.compile(rb"^<<<<<<<", re.M)
+
+# Line formats for the conflict viewer, colored once at import
+_OURS_FMT = Fore.RED + "%4d | %s\n"
+_SEP_FMT = Fore.YELLOW + "%4d | %s\n"
+_THEIRS_FMT = Fore.GREEN + "%4d | %s\n"
+_BODY_FMT = Fore.WHITE + "%4d | %s\n"
 
 def show_conflict_markers(filepath):
     """Show conflict markers in a file"""
     try:
-        with open(filepath, 'r') as f:
-            lines = f.readlines()
-        
-        in_conflict = False
-        conflict_count = 0
-        
-        for i, line in enumerate(lines, 1):
-            if line.startswith('<<<<<<<'):
-                in_conflict = True
-                conflict_count += 1
-                print(Fore.RED + f"{i:4d} | {line.rstrip()}")
-            elif line.startswith('======='):
-                print(Fore.YELLOW + f"{i:4d} | {line.rstrip()}")
-            elif line.startswith('>>>>>>>'):
-                in_conflict = False
-                print(Fore.GREEN + f"{i:4d} | {line.rstrip()}")
-            elif in_conflict:
-                print(Fore.WHITE + f"{i:4d} | {line.rstrip()}")
-        
-        return conflict_count
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return 0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _print_conflicts(mm)
     except Exception as e:
         print(Fore.RED + f"❌ Error reading file: {e}")
         return 0
 
+def _print_conflicts(mm):
+    """Print each conflict region of a mapped file; returns how many there are.
+
+    The regex finds region starts in C over the raw bytes, and the lines in
+    between are never decoded or even split; only the regions are read.
+    """
+    conflict_count = 0
+    out = []
+    pos, lineno = 0, 1
+    for match in _CONFLICT_START.finditer(mm):
+        start = match.start()
+        if start < pos:
+            continue  # inside a region already printed (unterminated conflict)
+        conflict_count += 1
+        lineno += mm[pos:start].count(b"\n")
+        mm.seek(start)
+        for line in iter(mm.readline, b""):
+            end = line.startswith(b'>>>>>>>')
+            if end:
+                fmt = _THEIRS_FMT
+            elif line.startswith(b'<<<<<<<'):
+                fmt = _OURS_FMT
+            elif line.startswith(b'======='):
+                fmt = _SEP_FMT
+            else:
+                fmt = _BODY_FMT
+            out.append(fmt % (lineno, line.rstrip().decode('utf-8', 'replace')))
+            lineno += 1
+            if end:
+                break
+        pos = mm.tell()
+        # Write in chunks rather than once per line
+        if len(out) >= 256:
+            sys.stdout.write("".join(out))
+            out.clear()
+    
+    sys.stdout.write("".join(out) + Style.RESET_ALL)
+    return conflict_count
+
+@functools.lru_cache(maxsize=1)
+def _detect_editor():
+    """Return the argv prefix for the editor to use, or None if none was found.
+
+    Looked up once per session with shutil.which() (a PATH scan, no process).
+    """
+    system = system_name()
+    if system == "Darwin":  # macOS
+        # Try VS Code first, then fall back to default
+        code = shutil.which("code")
+        return [code, "-w"] if code else ["open", "-t"]
+    if system == "Linux":
+        # Try common editors
+        for editor in ["code", "gedit", "nano", "vim"]:
+            path = shutil.which(editor)
+            if path:
+                return [path, "-w"] if editor == "code" else [path]
+        return None
+    if system == "Windows":
+        # Try VS Code first, then notepad
+        code = shutil.which("code")
+        return [code, "-w"] if code else ["notepad"]
+    return None
+
 def open_in_editor(filepath):
     """Open file in default editor"""
-    system = platform.system()
-    
+    editor = _detect_editor()
+    if editor is None:
+        print(Fore.RED + "❌ No editor found. Edit the file manually.")
+        return False
     try:
-        if system == "Darwin":  # macOS
-            # Try VS Code first, then fall back to default
-            if subprocess.run(["which", "code"], capture_output=True).returncode == 0:
-                subprocess.run(["code", "-w", filepath])
-            else:
-                subprocess.run(["open", "-t", filepath])
-        elif system == "Linux":
-            # Try common editors
-            editors = ["code", "gedit", "nano", "vim"]
-            for editor in editors:
-                if subprocess.run(["which", editor], capture_output=True).returncode == 0:
-                    if editor in ["nano", "vim"]:
-                        subprocess.run([editor, filepath])
-                    else:
-                        subprocess.run([editor, filepath])
-                    break
-        elif system == "Windows":
-            # Try VS Code first, then notepad
-            if subprocess.run(["where", "code"], capture_output=True).returncode == 0:
-                subprocess.run(["code", "-w", filepath])
-            else:
-                subprocess.run(["notepad", filepath])
-        
+        subprocess.run(editor + [filepath])
         return True
     except Exception as e:
         print(Fore.RED + f"❌ Error opening editor: {e}")
@@ -79,12 +155,12 @@ def open_in_editor(filepath):
 
 def resolve_conflicts():
     """Interactive conflict resolution helper"""
-    if not has_conflicts():
+    # One listing answers both "any conflicts?" and "which ones?"
+    conflicted_files = get_conflicted_files()
+    if not conflicted_files:
         print(Fore.GREEN + "\n✅ No conflicts detected!")
         return
     
-    conflicted_files = get_conflicted_files()
-    
     print(Fore.RED + "\n⚠️  Merge Conflicts Detected!")
     print(Fore.CYAN + f"\n📋 Conflicted Files ({len(conflicted_files)}):\n" + "-"*60)
     
@@ -138,8 +214,7 @@ def resolve_conflicts():
                         print(Fore.GREEN + "✅ Editor closed.")
                         mark = input("Mark this file as resolved? (y/N): ").lower()
                         if mark == "y":
-                            result = run_command(f"git add {filepath}", capture_output=False)
-                            if result is not None:
+                            if _git("add", "--", filepath):
                                 print(Fore.GREEN + f"✅ {filepath} marked as resolved!")
                                 conflicted_files.remove(filepath)
                                 if not conflicted_files:
@@ -153,109 +228,42 @@ def resolve_conflicts():
         
         elif choice == "3":
             # Accept ours
-            file_num = input(f"Enter file number (1-{len(conflicted_files)}, or 'all'): ").strip()
-            if file_num.lower() == "all":
-                confirm = input(Fore.YELLOW + "Accept current branch version for ALL files? (y/N): ").lower()
-                if confirm == "y":
-                    with yaspin(text="Accepting ours for all files...", color="cyan") as spinner:
-                        result = run_command("git checkout --ours .", capture_output=False)
-                        if result is not None:
-                            run_command("git add .", capture_output=False)
-                            spinner.ok("✅")
-                            print(Fore.GREEN + "✅ All files resolved with current branch version!")
-                            complete_merge()
-                            break
-                        else:
-                            spinner.fail("❌")
-            else:
-                try:
-                    idx = int(file_num) - 1
-                    if 0 <= idx < len(conflicted_files):
-                        filepath = conflicted_files[idx]
-                        confirm = input(Fore.YELLOW + f"Accept current branch version for {filepath}? (y/N): ").lower()
-                        if confirm == "y":
-                            result = run_command(f"git checkout --ours {filepath}", capture_output=False)
-                            if result is not None:
-                                run_command(f"git add {filepath}", capture_output=False)
-                                print(Fore.GREEN + f"✅ {filepath} resolved with current branch version!")
-                                conflicted_files.remove(filepath)
-                                if not conflicted_files:
-                                    print(Fore.GREEN + "\n🎉 All conflicts resolved!")
-                                    complete_merge()
-                                    break
-                    else:
-                        print(Fore.RED + "❌ Invalid file number.")
-                except ValueError:
-                    print(Fore.RED + "❌ Invalid input.")
+            conflicted_files = _accept_side("ours", conflicted_files)
+            if not conflicted_files:
+                break
         
         elif choice == "4":
             # Accept theirs
-            file_num = input(f"Enter file number (1-{len(conflicted_files)}, or 'all'): ").strip()
-            if file_num.lower() == "all":
-                confirm = input(Fore.YELLOW + "Accept incoming branch version for ALL files? (y/N): ").lower()
-                if confirm == "y":
-                    with yaspin(text="Accepting theirs for all files...", color="cyan") as spinner:
-                        result = run_command("git checkout --theirs .", capture_output=False)
-                        if result is not None:
-                            run_command("git add .", capture_output=False)
-                            spinner.ok("✅")
-                            print(Fore.GREEN + "✅ All files resolved with incoming branch version!")
-                            complete_merge()
-                            break
-                        else:
-                            spinner.fail("❌")
-            else:
-                try:
-                    idx = int(file_num) - 1
-                    if 0 <= idx < len(conflicted_files):
-                        filepath = conflicted_files[idx]
-                        confirm = input(Fore.YELLOW + f"Accept incoming branch version for {filepath}? (y/N): ").lower()
-                        if confirm == "y":
-                            result = run_command(f"git checkout --theirs {filepath}", capture_output=False)
-                            if result is not None:
-                                run_command(f"git add {filepath}", capture_output=False)
-                                print(Fore.GREEN + f"✅ {filepath} resolved with incoming branch version!")
-                                conflicted_files.remove(filepath)
-                                if not conflicted_files:
-                                    print(Fore.GREEN + "\n🎉 All conflicts resolved!")
-                                    complete_merge()
-                                    break
-                    else:
-                        print(Fore.RED + "❌ Invalid file number.")
-                except ValueError:
-                    print(Fore.RED + "❌ Invalid input.")
+            conflicted_files = _accept_side("theirs", conflicted_files)
+            if not conflicted_files:
+                break
         
         elif choice == "5":
             # Mark as resolved
-            file_num = input(f"Enter file number (1-{len(conflicted_files)}): ").strip()
-            try:
-                idx = int(file_num) - 1
-                if 0 <= idx < len(conflicted_files):
-                    filepath = conflicted_files[idx]
-                    result = run_command(f"git add {filepath}", capture_output=False)
-                    if result is not None:
-                        print(Fore.GREEN + f"✅ {filepath} marked as resolved!")
-                        conflicted_files.remove(filepath)
-                        if not conflicted_files:
-                            print(Fore.GREEN + "\n🎉 All conflicts resolved!")
-                            complete_merge()
-                            break
-                else:
-                    print(Fore.RED + "❌ Invalid file number.")
-            except ValueError:
-                print(Fore.RED + "❌ Invalid input.")
+            file_num = input(f"Enter file number(s) (1-{len(conflicted_files)}, e.g. 1,3,5-8, or 'all'): ").strip()
+            indices = _parse_indices(file_num, len(conflicted_files))
+            if indices is None:
+                print(Fore.RED + "❌ Invalid file number.")
+                continue
+            selected = [conflicted_files[i] for i in indices]
+            if _batch_git(["add"], selected):
+                target = selected[0] if len(selected) == 1 else f"{len(selected)} files"
+                print(Fore.GREEN + f"✅ {target} marked as resolved!")
+                done = set(selected)
+                conflicted_files = [f for f in conflicted_files if f not in done]
+                if not conflicted_files:
+                    print(Fore.GREEN + "\n🎉 All conflicts resolved!")
+                    complete_merge()
+                    break
         
         elif choice == "6":
             # Abort merge
             confirm = input(Fore.RED + "Abort merge and return to pre-merge state? (yes/N): ").lower()
             if confirm == "yes":
-                with yaspin(text="Aborting merge...", color="red") as spinner:
-                    result = run_command("git merge --abort", capture_output=False)
-                    if result is not None:
-                        spinner.ok("✅")
-                        print(Fore.GREEN + "✅ Merge aborted!")
-                    else:
-                        spinner.fail("❌")
+                if _git("merge", "--abort"):
+                    print(Fore.GREEN + "✅ Merge aborted!")
+                else:
+                    print(Fore.RED + "❌ Failed to abort merge.")
                 break
         
         elif choice == "7":
@@ -267,33 +275,74 @@ def resolve_conflicts():
         else:
             print(Fore.RED + "❌ Invalid option.")
 
+def _accept_side(side, conflicted_files):
+    """Resolve the chosen files with one side's version ("ours" or "theirs").
+
+    Returns the files still in conflict; an empty list means everything was
+    resolved and the merge has been completed.
+    """
+    which = "current" if side == "ours" else "incoming"
+    file_num = input(f"Enter file number(s) (1-{len(conflicted_files)}, e.g. 1,3,5-8, or 'all'): ").strip()
+    if file_num.lower() == "all":
+        selected = conflicted_files
+        target = "ALL files"
+    else:
+        indices = _parse_indices(file_num, len(conflicted_files))
+        if indices is None:
+            print(Fore.RED + "❌ Invalid file number.")
+            return conflicted_files
+        selected = [conflicted_files[i] for i in indices]
+        target = selected[0] if len(selected) == 1 else f"{len(selected)} files"
+    
+    confirm = input(Fore.YELLOW + f"Accept {which} branch version for {target}? (y/N): ").lower()
+    if confirm != "y":
+        return conflicted_files
+    if not (_batch_git(["checkout", f"--{side}"], selected) and _batch_git(["add"], selected)):
+        print(Fore.RED + f"❌ Failed to accept {which} branch version.")
+        return conflicted_files
+    
+    done = set(selected)
+    remaining = [f for f in conflicted_files if f not in done]
+    if remaining:
+        print(Fore.GREEN + f"✅ {target} resolved with {which} branch version!")
+        return remaining
+    if selected is conflicted_files:
+        print(Fore.GREEN + f"✅ All files resolved with {which} branch version!")
+    else:
+        print(Fore.GREEN + f"✅ {target} resolved with {which} branch version!")
+        print(Fore.GREEN + "\n🎉 All conflicts resolved!")
+    complete_merge()
+    return remaining
+
 def complete_merge():
     """Complete the merge after conflicts are resolved"""
     print(Fore.CYAN + "\n🎯 Ready to complete merge!")
     
-    # Check if it's a merge in progress
-    if os.path.exists(".git/MERGE_HEAD"):
+    # Check if it's a merge in progress. MERGE_HEAD lives in the git dir,
+    # which for linked worktrees and submodules isn't ./.git
+    repo = probe_repo()
+    git_dir = repo[0] if repo else ".git"
+    if os.path.exists(os.path.join(git_dir, "MERGE_HEAD")):
         print(Fore.CYAN + "Enter merge commit message (or press Enter for default):")
         message = input("> ").strip()
         
-        with yaspin(text="Completing merge...", color="cyan") as spinner:
-            if message:
-                result = run_command(f'git commit -m "{message}"', capture_output=False)
-            else:
-                result = run_command("git commit --no-edit", capture_output=False)
-            
-            if result is not None:
-                spinner.ok("✅")
-                print(Fore.GREEN + "✅ Merge completed successfully!")
-            else:
-                spinner.fail("❌")
+        # git commit writes its own summary line, so no spinner around it
+        if message:
+            ok = _git("commit", "-F", "-", input=message)
+        else:
+            ok = _git("commit", "--no-edit")
+        
+        if ok:
+            print(Fore.GREEN + "✅ Merge completed successfully!")
+        else:
+            print(Fore.RED + "❌ Failed to complete merge.")
     else:
         print(Fore.GREEN + "✅ Changes staged. Use 'gitcli commit' to commit.")
 
 def check_conflicts():
     """Quick check for conflicts"""
-    if has_conflicts():
-        conflicted_files = get_conflicted_files()
+    conflicted_files = get_conflicted_files()
+    if conflicted_files:
         print(Fore.RED + f"\n⚠️  {len(conflicted_files)} file(s) with conflicts:")
         for filepath in conflicted_files:
             print(f"  • {Fore.YELLOW}{filepath}")
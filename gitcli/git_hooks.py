@@ -1,55 +1,203 @@
 import os
+import sys
 import stat
-import json
+import copy
+import functools
 import glob
-from colorama import Fore
-from .helpers import run_command, display_command
+from colorama import Fore, Style
 from .hook_templates import HOOKS_DIR, CONFIG_FILE, LANGUAGE_TOOLS, HOOK_TEMPLATES
 
+# Use orjson for the hooks config when it's installed, stdlib json otherwise.
+# Both sides work in bytes so the file is read and written without decoding.
+try:
+    import orjson as _json
+    _loads = _json.loads
+    _dumps = lambda obj: _json.dumps(obj, option=_json.OPT_INDENT_2)
+except ImportError:
+    import json as _json
+    _loads = _json.loads
+    _dumps = lambda obj: _json.dumps(obj, indent=2).encode("utf-8")
+
+# Parsed hooks config, keyed on the file's stat so edits from outside are seen
+_config_cache = {"key": None, "config": None}
+
+
+def _config_key():
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+# Flat (hook_type, template_key) -> template index over HOOK_TEMPLATES
+_TMPL = {
+    (hook_type, template_key): template
+    for hook_type, info in HOOK_TEMPLATES.items()
+    for template_key, template in info["templates"].items()
+}
+_HOOK_TYPE_NAMES = {hook_type: info["name"] for hook_type, info in HOOK_TEMPLATES.items()}
+
+
+# Recurring messages, colored once at import
+_ERR_INVALID_OPTION = Fore.RED + "❌ Invalid option."
+_ERR_INVALID_INPUT = Fore.RED + "❌ Invalid input."
+_ERR_NOT_REPO = Fore.RED + "❌ Not a git repository."
+_WARN_BAD_SELECTION = Fore.YELLOW + "  ⚠️  Invalid selection, skipping."
+_HOOKS_MENU = (
+    Fore.CYAN + "\n🪝 Git Hooks Management:" + Style.RESET_ALL + "\n"
+    "  1. Install hook\n"
+    "  2. Uninstall hook\n"
+    "  3. List installed hooks\n"
+    "  4. View hook templates\n"
+    "  5. Back\n"
+)
+
 
 # Utility functions
 def get_hooks_config():
     """Load hooks configuration"""
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    return {"enabled_hooks": {}}
+    key = _config_key()
+    if key is None:
+        return {"enabled_hooks": {}}
+    if _config_cache["key"] != key:
+        with open(CONFIG_FILE, 'rb') as f:
+            _config_cache["config"] = _loads(f.read())
+        _config_cache["key"] = key
+    # Callers edit the result before saving it, so hand out a copy
+    return copy.deepcopy(_config_cache["config"])
 
 
 def save_hooks_config(config):
     """Save hooks configuration"""
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    # Serialize up front and write it in one go to a temp file, then rename
+    # over the config so a crash never leaves it half-written
+    data = _dumps(config)
+    tmp = CONFIG_FILE + ".tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, CONFIG_FILE)
+    _config_cache["config"] = copy.deepcopy(config)
+    _config_cache["key"] = _config_key()
+
 
+_EXEC_BITS = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
 
-def make_executable(filepath):
-    """Make a file executable"""
-    st = os.stat(filepath)
-    os.chmod(filepath, st.st_mode | stat.S_IEXEC)
+# Files in the hooks dir that are not installed hooks
+_SKIP_SUFFIXES = ('.sample', '.backup')
+
+
+def _build_detect_table(language_tools):
+    """Split each language's detection patterns into suffixes, exact names and globs."""
+    table = {}
+    for lang, info in language_tools.items():
+        suffixes, names, globs = set(), set(), []
+        for pattern in info["detection"]:
+            if pattern.startswith("*.") and "*" not in pattern[1:]:
+                suffixes.add(pattern[1:])
+            elif "*" in pattern:
+                globs.append(pattern)
+            else:
+                names.add(pattern)
+        table[lang] = (frozenset(suffixes), frozenset(names), tuple(globs))
+    return table
+
+
+_DETECT_TABLE = _build_detect_table(LANGUAGE_TOOLS)
 
 
 def detect_languages():
     """Detect languages used in the current repository"""
+    # Detection only looks at the top-level entries, and adding or removing
+    # one updates the directory's mtime, so that makes an exact cache key
+    cwd = os.getcwd()
+    return list(_detect_languages(cwd, os.stat(cwd).st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=8)
+def _detect_languages(cwd, mtime_ns):
+    # One scandir of the directory answers every pattern: exact names by set
+    # membership and "*.ext" patterns by suffix, instead of a glob per pattern
+    names = set()
+    suffixes = set()
+    with os.scandir(cwd) as it:
+        for entry in it:
+            names.add(entry.name)
+            if not entry.name.startswith("."):  # glob's * skips dotfiles
+                suffixes.add(os.path.splitext(entry.name)[1])
+    
     detected = []
-    for lang, info in LANGUAGE_TOOLS.items():
-        for pattern in info["detection"]:
-            if "*" in pattern:
-                # File pattern
-                if glob.glob(pattern, recursive=True):
-                    detected.append(lang)
-                    break
-            else:
-                # Specific file
-                if os.path.exists(pattern):
-                    detected.append(lang)
-                    break
-    return detected
+    for lang, (lang_suffixes, lang_names, lang_globs) in _DETECT_TABLE.items():
+        if not lang_suffixes.isdisjoint(suffixes) or not lang_names.isdisjoint(names) or any(
+            glob.glob(os.path.join(glob.escape(cwd), pattern), recursive=True) for pattern in lang_globs
+        ):
+            detected.append(lang)
+    return tuple(detected)
 
 
 # Hook script generation
+# Shell fragments for one tool or command; `bin` is the tool's first word
+_TOOL_BLOCK = (
+    "if command -v {bin} >/dev/null 2>&1; then\n"
+    '    echo "  → Running {tool}..."\n'
+    "    {cmd} || exit 1\n"
+    "fi"
+)
+_FORMAT_BLOCK = (
+    "if command -v {bin} >/dev/null 2>&1; then\n"
+    '    echo "  → Formatting with {tool}..."\n'
+    "    {cmd}\n"
+    "    git add -u\n"
+    "fi"
+)
+_COMMAND_STEP = 'echo "  → {cmd}"\n{cmd} || exit 1'
+
+# Tool-driven templates: header, LANGUAGE_TOOLS key, per-tool block, footer
+_BRANCH_SPEC = {
+    "linting": ("🔍 Running linters...", "linters", _TOOL_BLOCK, "Linting passed!"),
+    "formatting": ("🎨 Auto-formatting code...", "formatters", _FORMAT_BLOCK, "Formatting complete!"),
+    "tests": ("🧪 Running tests...", "test_runners", _TOOL_BLOCK, "Tests passed!"),
+}
+
+
+class _Items(tuple):
+    """A frozen dict: its (key, value) pairs in insertion order."""
+
+
+def _freeze(obj):
+    """Turn nested dicts/lists into hashable tuples for use as a cache key.
+
+    Key order is kept, since the order languages were picked in is the order
+    their steps appear in the script.
+    """
+    if isinstance(obj, dict):
+        return _Items((k, _freeze(v)) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def _thaw(obj):
+    """Inverse of _freeze."""
+    if isinstance(obj, _Items):
+        return {k: _thaw(v) for k, v in obj}
+    if isinstance(obj, tuple):
+        return [_thaw(v) for v in obj]
+    return obj
+
+
 def generate_hook_script(hook_type, template_key, config):
     """Generate hook script based on configuration"""
-    template = HOOK_TEMPLATES[hook_type]["templates"][template_key]
+    return _generate_hook_script_cached(hook_type, template_key, _freeze(config))
+
+
+@functools.lru_cache(maxsize=64)
+def _generate_hook_script_cached(hook_type, template_key, frozen):
+    return _generate_hook_script(hook_type, template_key, _thaw(frozen))
+
+
+def _generate_hook_script(hook_type, template_key, config):
+    template = _TMPL[(hook_type, template_key)]
     
     # If template has a static script, use it
     if "script" in template:
@@ -61,90 +209,46 @@ def generate_hook_script(hook_type, template_key, config):
         f"# GitCLI: {template['name']} Hook",
         "",
     ]
+    _app = script_lines.append
     
-    if template_key == "linting":
-        script_lines.append('echo "🔍 Running linters..."')
-        script_lines.append("")
-        
-        for lang, tools in config.get("languages", {}).items():
-            if "linters" in tools and tools["linters"]:
-                lang_name = LANGUAGE_TOOLS[lang]["name"]
-                script_lines.append(f"# {lang_name}")
-                for tool in tools["linters"]:
-                    cmd = LANGUAGE_TOOLS[lang]["linters"][tool]
-                    tool_bin = tool.split()[0] if " " in tool else tool
-                    script_lines.append(f"if command -v {tool_bin} >/dev/null 2>&1; then")
-                    script_lines.append(f'    echo "  → Running {tool}..."')
-                    script_lines.append(f"    {cmd} || exit 1")
-                    script_lines.append("fi")
-                script_lines.append("")
-        
-        script_lines.append('echo "✅ Linting passed!"')
-    
-    elif template_key == "formatting":
-        script_lines.append('echo "🎨 Auto-formatting code..."')
-        script_lines.append("")
-        
-        for lang, tools in config.get("languages", {}).items():
-            if "formatters" in tools and tools["formatters"]:
-                lang_name = LANGUAGE_TOOLS[lang]["name"]
-                script_lines.append(f"# {lang_name}")
-                for tool in tools["formatters"]:
-                    cmd = LANGUAGE_TOOLS[lang]["formatters"][tool]
-                    tool_bin = tool.split()[0] if " " in tool else tool
-                    script_lines.append(f"if command -v {tool_bin} >/dev/null 2>&1; then")
-                    script_lines.append(f'    echo "  → Formatting with {tool}..."')
-                    script_lines.append(f"    {cmd}")
-                    script_lines.append("    git add -u")
-                    script_lines.append("fi")
-                script_lines.append("")
-        
-        script_lines.append('echo "✅ Formatting complete!"')
-    
-    elif template_key == "tests":
-        script_lines.append('echo "🧪 Running tests..."')
-        script_lines.append("")
+    if template_key in _BRANCH_SPEC:
+        header, key, block, footer = _BRANCH_SPEC[template_key]
+        _app(f'echo "{header}"')
+        _app("")
         
         for lang, tools in config.get("languages", {}).items():
-            if "test_runners" in tools and tools["test_runners"]:
-                lang_name = LANGUAGE_TOOLS[lang]["name"]
-                script_lines.append(f"# {lang_name}")
-                for tool in tools["test_runners"]:
-                    cmd = LANGUAGE_TOOLS[lang]["test_runners"][tool]
-                    tool_bin = tool.split()[0] if " " in tool else tool
-                    script_lines.append(f"if command -v {tool_bin} >/dev/null 2>&1; then")
-                    script_lines.append(f'    echo "  → Running {tool}..."')
-                    script_lines.append(f"    {cmd} || exit 1")
-                    script_lines.append("fi")
-                script_lines.append("")
+            if key in tools and tools[key]:
+                lt = LANGUAGE_TOOLS[lang]
+                cmds = lt.get(key) or {}
+                _app(f"# {lt['name']}")
+                _app("\n".join(
+                    block.format(bin=tool.split()[0], tool=tool, cmd=cmds[tool])
+                    for tool in tools[key]
+                ))
+                _app("")
         
-        script_lines.append('echo "✅ Tests passed!"')
+        _app(f'echo "✅ {footer}"')
     
     elif template_key == "build":
-        script_lines.append('echo "🔨 Building project..."')
-        script_lines.append("")
+        _app('echo "🔨 Building project..."')
+        _app("")
         
         for lang, tools in config.get("languages", {}).items():
             if "build_commands" in tools and tools["build_commands"]:
-                lang_name = LANGUAGE_TOOLS[lang]["name"]
-                script_lines.append(f"# {lang_name}")
-                for cmd in tools["build_commands"]:
-                    script_lines.append(f'echo "  → {cmd}"')
-                    script_lines.append(f"{cmd} || exit 1")
-                script_lines.append("")
+                _app(f"# {LANGUAGE_TOOLS[lang]['name']}")
+                _app("\n".join(_COMMAND_STEP.format(cmd=cmd) for cmd in tools["build_commands"]))
+                _app("")
         
-        script_lines.append('echo "✅ Build successful!"')
+        _app('echo "✅ Build successful!"')
     
     elif template_key == "custom":
-        script_lines.append('echo "⚙️  Running custom commands..."')
-        script_lines.append("")
+        _app('echo "⚙️  Running custom commands..."')
+        _app("")
         
-        for cmd in config.get("custom_commands", []):
-            script_lines.append(f'echo "  → {cmd}"')
-            script_lines.append(f"{cmd} || exit 1")
+        script_lines.extend(_COMMAND_STEP.format(cmd=cmd) for cmd in config.get("custom_commands", []))
         
-        script_lines.append("")
-        script_lines.append('echo "✅ Custom commands completed!"')
+        _app("")
+        _app('echo "✅ Custom commands completed!"')
     
     return "\n".join(script_lines) + "\n"
 
@@ -152,18 +256,17 @@ def generate_hook_script(hook_type, template_key, config):
 # Hook installation/management
 def install_hook(hook_type, template_key, hook_config=None):
     """Install a specific hook template"""
-    if not os.path.exists(HOOKS_DIR):
-        print(Fore.RED + "❌ Not a git repository or hooks directory not found.")
-        return False
-    
-    template = HOOK_TEMPLATES[hook_type]["templates"][template_key]
+    template = _TMPL[(hook_type, template_key)]
     hook_path = os.path.join(HOOKS_DIR, hook_type)
     
-    # Backup existing hook
-    if os.path.exists(hook_path):
-        backup_path = f"{hook_path}.backup"
-        print(Fore.YELLOW + f"⚠️  Existing {hook_type} hook found. Creating backup...")
+    # Backup existing hook; a missing hook (or hooks dir) just means no backup
+    backup_path = f"{hook_path}.backup"
+    try:
         os.rename(hook_path, backup_path)
+    except FileNotFoundError:
+        pass
+    else:
+        print(Fore.YELLOW + f"⚠️  Existing {hook_type} hook found. Creating backup...")
         print(Fore.GREEN + f"✅ Backup created: {backup_path}")
     
     # Generate script
@@ -172,12 +275,20 @@ def install_hook(hook_type, template_key, hook_config=None):
     else:
         script = template.get("script", "")
     
-    # Write new hook
-    with open(hook_path, 'w') as f:
-        f.write(script)
-    
-    # Make executable
-    make_executable(hook_path)
+    # Write new hook, created executable so it needs no chmod afterwards.
+    # The old hook was moved aside above, so O_CREAT always applies the mode
+    try:
+        fd = os.open(hook_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    except FileNotFoundError:
+        print(Fore.RED + "❌ Not a git repository or hooks directory not found.")
+        return False
+    # Hook scripts are small, so this is normally a single unbuffered write
+    data = script.encode("utf-8")
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
     
     # Update config
     config = get_hooks_config()
@@ -199,20 +310,20 @@ def uninstall_hook(hook_type):
     """Uninstall a hook"""
     hook_path = os.path.join(HOOKS_DIR, hook_type)
     
-    if not os.path.exists(hook_path):
+    try:
+        os.remove(hook_path)
+    except FileNotFoundError:
         print(Fore.YELLOW + f"⚠️  Hook {hook_type} is not installed.")
         return False
     
-    # Check for backup
-    backup_path = f"{hook_path}.backup"
-    if os.path.exists(backup_path):
+    # Restore the backup if there is one
+    try:
+        os.rename(f"{hook_path}.backup", hook_path)
+    except FileNotFoundError:
+        print(Fore.GREEN + f"✅ Hook {hook_type} removed.")
+    else:
         print(Fore.CYAN + "Restoring backup...")
-        os.remove(hook_path)
-        os.rename(backup_path, hook_path)
         print(Fore.GREEN + "✅ Backup restored.")
-    else:
-        os.remove(hook_path)
-        print(Fore.GREEN + f"✅ Hook {hook_type} removed.")
     
     # Update config
     config = get_hooks_config()
@@ -224,6 +335,27 @@ def uninstall_hook(hook_type):
 
 
 # Configuration functions
+# Per-template tool prompt: LANGUAGE_TOOLS key, label, prompt, max picks
+_TOOL_PROMPTS = {
+    "linting": ("linters", "linters", "Select linters (space-separated, e.g., '1 2')", None),
+    "formatting": ("formatters", "formatters", "Select formatters (space-separated, e.g., '1')", None),
+    "tests": ("test_runners", "test runners", "Select test runner (enter number)", 1),
+}
+
+
+def _parse_selection(choices, items):
+    """Map 1-based numbers in `choices` to items, ignoring bad or repeated tokens."""
+    selected = []
+    for token in choices.split():
+        try:
+            i = int(token) - 1
+        except ValueError:
+            continue
+        if 0 <= i < len(items):
+            selected.append(items[i])
+    return list(dict.fromkeys(selected))
+
+
 def configure_language_tools(template_key):
     """Configure language-specific tools for a template"""
     # Detect languages
@@ -257,9 +389,10 @@ def configure_language_tools(template_key):
     
     try:
         indices = [int(x) - 1 for x in selections.split()]
-        selected_langs = [available_langs[i] for i in indices if 0 <= i < len(available_langs)]
+        # "1 1" would otherwise configure the same language twice
+        selected_langs = list(dict.fromkeys(available_langs[i] for i in indices if 0 <= i < len(available_langs)))
     except (ValueError, IndexError):
-        print(Fore.RED + "❌ Invalid input.")
+        print(_ERR_INVALID_INPUT)
         return None
     
     if not selected_langs:
@@ -270,53 +403,26 @@ def configure_language_tools(template_key):
     config = {"languages": {}}
     
     for lang in selected_langs:
-        print(Fore.CYAN + f"\n⚙️  Configuring {LANGUAGE_TOOLS[lang]['name']}:")
+        lt = LANGUAGE_TOOLS[lang]
+        print(Fore.CYAN + f"\n⚙️  Configuring {lt['name']}:")
         lang_config = {}
         
         # Configure based on template type
-        if template_key in ["linting", "tests", "formatting"]:
-            if template_key == "linting" and "linters" in LANGUAGE_TOOLS[lang]:
-                print(Fore.CYAN + "  Available linters:")
-                linters = list(LANGUAGE_TOOLS[lang]["linters"].keys())
-                for i, tool in enumerate(linters, 1):
-                    print(f"    {i}. {tool}")
-                
-                choices = input(f"  Select linters (space-separated, e.g., '1 2'): ").strip()
-                if choices:
-                    try:
-                        selected = [linters[int(x) - 1] for x in choices.split() if 0 < int(x) <= len(linters)]
-                        lang_config["linters"] = selected
-                    except (ValueError, IndexError):
-                        print(Fore.YELLOW + "  ⚠️  Invalid selection, skipping.")
-            
-            elif template_key == "formatting" and "formatters" in LANGUAGE_TOOLS[lang]:
-                print(Fore.CYAN + "  Available formatters:")
-                formatters = list(LANGUAGE_TOOLS[lang]["formatters"].keys())
-                for i, tool in enumerate(formatters, 1):
-                    print(f"    {i}. {tool}")
-                
-                choices = input(f"  Select formatters (space-separated, e.g., '1'): ").strip()
-                if choices:
-                    try:
-                        selected = [formatters[int(x) - 1] for x in choices.split() if 0 < int(x) <= len(formatters)]
-                        lang_config["formatters"] = selected
-                    except (ValueError, IndexError):
-                        print(Fore.YELLOW + "  ⚠️  Invalid selection, skipping.")
+        spec = _TOOL_PROMPTS.get(template_key)
+        if spec and spec[0] in lt:
+            key, label, prompt, limit = spec
+            print(Fore.CYAN + f"  Available {label}:")
+            items = list(lt[key].keys())
+            for i, tool in enumerate(items, 1):
+                print(f"    {i}. {tool}")
             
-            elif template_key == "tests" and "test_runners" in LANGUAGE_TOOLS[lang]:
-                print(Fore.CYAN + "  Available test runners:")
-                runners = list(LANGUAGE_TOOLS[lang]["test_runners"].keys())
-                for i, tool in enumerate(runners, 1):
-                    print(f"    {i}. {tool}")
-                
-                choices = input(f"  Select test runner (enter number): ").strip()
-                if choices:
-                    try:
-                        idx = int(choices) - 1
-                        if 0 <= idx < len(runners):
-                            lang_config["test_runners"] = [runners[idx]]
-                    except ValueError:
-                        print(Fore.YELLOW + "  ⚠️  Invalid selection, skipping.")
+            choices = input(f"  {prompt}: ").strip()
+            if choices:
+                selected = _parse_selection(choices, items)[:limit]
+                if selected:
+                    lang_config[key] = selected
+                else:
+                    print(_WARN_BAD_SELECTION)
         
         if lang_config:
             config["languages"][lang] = lang_config
@@ -346,59 +452,60 @@ def configure_custom_commands():
 # UI functions
 def list_installed_hooks():
     """List all installed hooks"""
-    if not os.path.exists(HOOKS_DIR):
-        print(Fore.RED + "❌ Not a git repository.")
+    # scandir's entries carry their file type, and one stat gives the mode
+    try:
+        with os.scandir(HOOKS_DIR) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except FileNotFoundError:
+        print(_ERR_NOT_REPO)
         return
     
-    print(Fore.CYAN + "\n🪝 Installed Git Hooks:\n" + "-"*60)
+    # Collect the listing and write it in one go
+    out = [Fore.CYAN + "\n🪝 Installed Git Hooks:\n" + "-"*60]
     
     config = get_hooks_config()
     enabled_hooks = config.get("enabled_hooks", {})
     
     hooks_found = False
-    for hook_file in os.listdir(HOOKS_DIR):
-        hook_path = os.path.join(HOOKS_DIR, hook_file)
-        if os.path.isfile(hook_path) and not hook_file.endswith('.sample') and not hook_file.endswith('.backup'):
+    for entry in entries:
+        hook_file = entry.name
+        if entry.is_file() and not hook_file.endswith(_SKIP_SUFFIXES):
             hooks_found = True
-            # Check if executable
-            is_executable = os.access(hook_path, os.X_OK)
+            # Check if executable (Windows has no exec bit; git runs hooks regardless)
+            is_executable = os.name == "nt" or bool(entry.stat().st_mode & _EXEC_BITS)
             status = Fore.GREEN + "✅ Active" if is_executable else Fore.YELLOW + "⚠️  Not executable"
-            print(f"  {Fore.WHITE}{hook_file.ljust(20)} {status}")
+            out.append(f"  {Fore.WHITE}{hook_file.ljust(20)} {status}")
             
             # Show configuration if available
             if hook_file in enabled_hooks:
                 hook_info = enabled_hooks[hook_file]
                 template_name = hook_info.get("template", "unknown")
-                print(f"    {Fore.CYAN}Template: {template_name}")
+                out.append(f"    {Fore.CYAN}Template: {template_name}")
                 
                 hook_config = hook_info.get("config", {})
                 if "languages" in hook_config:
                     langs = list(hook_config["languages"].keys())
-                    print(f"    {Fore.CYAN}Languages: {', '.join(langs)}")
+                    out.append(f"    {Fore.CYAN}Languages: {', '.join(langs)}")
                     for lang, tools in hook_config["languages"].items():
                         for tool_type, tool_list in tools.items():
                             if tool_list:
-                                print(f"      {Fore.YELLOW}{lang} {tool_type}: {', '.join(tool_list)}")
+                                out.append(f"      {Fore.YELLOW}{lang} {tool_type}: {', '.join(tool_list)}")
                 
                 if "custom_commands" in hook_config:
-                    print(f"    {Fore.CYAN}Custom commands:")
+                    out.append(f"    {Fore.CYAN}Custom commands:")
                     for cmd in hook_config["custom_commands"]:
-                        print(f"      {Fore.YELLOW}• {cmd}")
+                        out.append(f"      {Fore.YELLOW}• {cmd}")
     
     if not hooks_found:
-        print(Fore.YELLOW + "  No hooks installed.")
+        out.append(Fore.YELLOW + "  No hooks installed.")
     
-    print(Fore.CYAN + "-"*60 + "\n")
+    out.append(Fore.CYAN + "-"*60 + "\n")
+    sys.stdout.write("\n".join(out) + Style.RESET_ALL + "\n")
 
 
 def manage_hooks():
     """Main hooks management interface"""
-    print(Fore.CYAN + "\n🪝 Git Hooks Management:")
-    print("  1. Install hook")
-    print("  2. Uninstall hook")
-    print("  3. List installed hooks")
-    print("  4. View hook templates")
-    print("  5. Back")
+    sys.stdout.write(_HOOKS_MENU)
     
     choice = input("\nChoose option (1-5): ").strip()
     
@@ -413,7 +520,7 @@ def manage_hooks():
     elif choice == "5":
         return
     else:
-        print(Fore.RED + "❌ Invalid option.")
+        print(_ERR_INVALID_OPTION)
 
 
 def install_hook_menu():
@@ -421,8 +528,7 @@ def install_hook_menu():
     print(Fore.CYAN + "\n📋 Available Hook Types:")
     hook_types = list(HOOK_TEMPLATES.keys())
     
-    for i, hook_type in enumerate(hook_types, 1):
-        hook_info = HOOK_TEMPLATES[hook_type]
+    for i, hook_info in enumerate(HOOK_TEMPLATES.values(), 1):
         print(f"  {i}. {Fore.WHITE}{hook_info['name']}{Fore.CYAN} - {hook_info['description']}")
     
     choice = input(f"\nChoose hook type (1-{len(hook_types)}): ").strip()
@@ -430,13 +536,13 @@ def install_hook_menu():
     try:
         hook_index = int(choice) - 1
         if hook_index < 0 or hook_index >= len(hook_types):
-            print(Fore.RED + "❌ Invalid option.")
+            print(_ERR_INVALID_OPTION)
             return
         
         hook_type = hook_types[hook_index]
         select_template(hook_type)
     except ValueError:
-        print(Fore.RED + "❌ Invalid input.")
+        print(_ERR_INVALID_INPUT)
 
 
 def select_template(hook_type):
@@ -444,7 +550,7 @@ def select_template(hook_type):
     templates = HOOK_TEMPLATES[hook_type]["templates"]
     template_keys = list(templates.keys())
     
-    print(Fore.CYAN + f"\n📝 Available Templates for {HOOK_TEMPLATES[hook_type]['name']}:")
+    print(Fore.CYAN + f"\n📝 Available Templates for {_HOOK_TYPE_NAMES[hook_type]}:")
     
     for i, key in enumerate(template_keys, 1):
         template = templates[key]
@@ -455,7 +561,7 @@ def select_template(hook_type):
     try:
         template_index = int(choice) - 1
         if template_index < 0 or template_index >= len(template_keys):
-            print(Fore.RED + "❌ Invalid option.")
+            print(_ERR_INVALID_OPTION)
             return
         
         template_key = template_keys[template_index]
@@ -478,22 +584,20 @@ def select_template(hook_type):
             print(Fore.GREEN + f"✅ Hook installed successfully!")
             print(Fore.YELLOW + f"💡 This hook will run automatically on {hook_type}")
     except ValueError:
-        print(Fore.RED + "❌ Invalid input.")
+        print(_ERR_INVALID_INPUT)
 
 
 def uninstall_hook_menu():
     """Menu for uninstalling hooks"""
-    if not os.path.exists(HOOKS_DIR):
-        print(Fore.RED + "❌ Not a git repository.")
+    # Get installed hooks; backups are restored by uninstall, not listed
+    try:
+        with os.scandir(HOOKS_DIR) as it:
+            installed = [entry.name for entry in it
+                         if entry.is_file() and not entry.name.endswith(_SKIP_SUFFIXES)]
+    except FileNotFoundError:
+        print(_ERR_NOT_REPO)
         return
     
-    # Get installed hooks
-    installed = []
-    for hook_file in os.listdir(HOOKS_DIR):
-        hook_path = os.path.join(HOOKS_DIR, hook_file)
-        if os.path.isfile(hook_path) and not hook_file.endswith('.sample'):
-            installed.append(hook_file)
-    
     if not installed:
         print(Fore.YELLOW + "⚠️  No hooks installed.")
         return
@@ -507,7 +611,7 @@ def uninstall_hook_menu():
     try:
         hook_index = int(choice) - 1
         if hook_index < 0 or hook_index >= len(installed):
-            print(Fore.RED + "❌ Invalid option.")
+            print(_ERR_INVALID_OPTION)
             return
         
         hook_type = installed[hook_index]
@@ -519,20 +623,30 @@ def uninstall_hook_menu():
         else:
             print(Fore.CYAN + "🚫 Uninstall canceled.")
     except ValueError:
-        print(Fore.RED + "❌ Invalid input.")
+        print(_ERR_INVALID_INPUT)
 
 
-def view_templates():
-    """View all available hook templates"""
-    print(Fore.CYAN + "\n📚 Available Hook Templates:\n" + "="*60)
+def _render_templates():
+    # Each line ends with a reset since the listing is written in one go
+    lines = [Fore.CYAN + "\n📚 Available Hook Templates:\n" + "="*60 + Style.RESET_ALL]
     
     for hook_type, hook_info in HOOK_TEMPLATES.items():
-        print(Fore.MAGENTA + f"\n{hook_info['name']} ({hook_type})")
-        print(Fore.CYAN + f"{hook_info['description']}")
-        print(Fore.CYAN + "-"*60)
+        lines.append(Fore.MAGENTA + f"\n{hook_info['name']} ({hook_type})" + Style.RESET_ALL)
+        lines.append(Fore.CYAN + f"{hook_info['description']}" + Style.RESET_ALL)
+        lines.append(Fore.CYAN + "-"*60 + Style.RESET_ALL)
         
         for template_key, template in hook_info["templates"].items():
-            print(f"  • {Fore.WHITE}{template['name']}{Fore.CYAN} - {template['description']}")
+            lines.append(f"  • {Fore.WHITE}{template['name']}{Fore.CYAN} - {template['description']}" + Style.RESET_ALL)
     
-    print(Fore.CYAN + "\n" + "="*60 + "\n")
+    lines.append(Fore.CYAN + "\n" + "="*60 + "\n" + Style.RESET_ALL)
+    return "\n".join(lines) + "\n"
+
+
+# The templates never change at runtime, so the listing is formatted once
+_TEMPLATES_TEXT = _render_templates()
+
+
+def view_templates():
+    """View all available hook templates"""
+    sys.stdout.write(_TEMPLATES_TEXT)
 
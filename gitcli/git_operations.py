@@ -1,12 +1,11 @@
-import subprocess
 import os
+import shlex
 from colorama import Fore
-from yaspin import yaspin
 from .helpers import (
     run_command, send_notification, get_current_branch,
     has_staged_changes, has_unstaged_changes, has_any_changes, has_remote, display_command,
     get_config, generate_commit_message, check_for_conflicts, validate_changes, check_large_files,
-    run_formatter
+    run_formatter, run_chain, run_process, ahead_behind, repo_state, parallel_checks, spin
 )
 
 
@@ -18,15 +17,17 @@ def smart_save(commit_message=None):
     3. Smart commit message with suggestions
     4. Configurable auto-push
     """
-    branch = get_current_branch()
+    checks = parallel_checks(remote=has_remote, state=repo_state)
+    state = checks["state"]
+    branch = state["branch"]
     config = get_config()
     
     # Check if there are any changes
-    if not has_any_changes():
+    if not (state["staged"] or state["unstaged"]):
         # Check for unpushed commits
-        if has_remote():
-            ahead = run_command("git rev-list --count @{u}..HEAD 2>/dev/null")
-            if ahead and int(ahead) > 0:
+        if checks["remote"]:
+            ahead = state["ahead"]
+            if ahead > 0:
                 print(Fore.CYAN + f"\n📤 You have {ahead} unpushed commit(s) on '{branch}'")
                 
                 if config.get("auto_push", True):
@@ -106,12 +107,10 @@ def smart_save(commit_message=None):
     # Step 1: Stage all changes
     if config.get("auto_stage", True):
         print(Fore.CYAN + "\n📦 Staging all changes...")
-        with yaspin(text="Staging...", color="cyan") as spinner:
-            run_command("git add .", capture_output=False)
-            spinner.ok("✅")
+        run_command(["git", "add", "."], capture_output=False)
         
         # Count staged files
-        staged_files = run_command("git diff --cached --name-only")
+        staged_files = run_command(["git", "diff", "--cached", "--name-only"])
         if staged_files:
             file_list = staged_files.strip().split('\n')
             file_count = len(file_list)
@@ -136,8 +135,8 @@ def smart_save(commit_message=None):
             print(Fore.GREEN + f"✅ Using: \"{commit_message}\"")
     
     # Commit
-    with yaspin(text="Committing...", color="cyan") as spinner:
-        result = run_command(f'git commit -m "{commit_message}"', capture_output=False)
+    with spin("Committing...", "cyan") as spinner:
+        result = run_command(["git", "commit", "-F", "-"], capture_output=False, input=commit_message)
         if result is not None:
             spinner.ok("✅")
             print(Fore.GREEN + "✅ Changes committed!")
@@ -146,20 +145,20 @@ def smart_save(commit_message=None):
             return
     
     # Step 3: Push based on configuration
-    if has_remote():
+    if checks["remote"]:
         if config.get("auto_push", True):
             # Auto-pull before push if enabled
             if config.get("auto_pull_before_push", True):
                 print(Fore.CYAN + "\n⬇️  Pulling latest changes before push...")
-                with yaspin(text="Pulling...", color="cyan") as spinner:
-                    result = subprocess.run("git pull --rebase", shell=True, capture_output=True, text=True)
+                with spin("Pulling...", "cyan") as spinner:
+                    result = run_process(["git", "pull", "--rebase"])
                     if result.returncode == 0:
                         spinner.ok("✅")
                         if "Already up to date" not in result.stdout:
                             print(Fore.GREEN + "✅ Pulled latest changes!")
                             # Show what changed
                             print(Fore.CYAN + "Changes from remote:")
-                            subprocess.run("git log --oneline HEAD@{1}..HEAD", shell=True)
+                            display_command(["git", "log", "--oneline", "HEAD@{1}..HEAD"])
                         else:
                             print(Fore.GREEN + "✅ Already up to date!")
                     else:
@@ -187,13 +186,12 @@ def smart_save(commit_message=None):
         print(Fore.GREEN + "✅ Staged and committed successfully!")
 
 def commit_changes():
-    if not has_staged_changes():
-        if has_unstaged_changes():
-            print(Fore.CYAN + "📦 No staged changes. Staging all changes...")
-            with yaspin(text="Staging all changes...", color="cyan") as spinner:
-                run_command("git add .", capture_output=False)
-                spinner.ok("✅")
-            print(Fore.GREEN + "✅ All changes staged.")
+    state = repo_state()
+    stage_all = False
+    if not state["staged"]:
+        if state["unstaged"]:
+            print(Fore.CYAN + "📦 No staged changes. All changes will be staged.")
+            stage_all = True
         else:
             print(Fore.YELLOW + "⚠️  No changes to commit.")
             return
@@ -203,78 +201,116 @@ def commit_changes():
     if not message:
         print(Fore.RED + "❌ Commit message cannot be empty.")
         return
-    with yaspin(text="Committing changes...", color="cyan") as spinner:
-        run_command(f'git commit -m "{message}"', capture_output=False)
-        spinner.ok("✅")
+    if stage_all:
+        with spin("Staging and committing changes...", "cyan") as spinner:
+            result = run_chain([["git", "add", "."], ["git", "commit", "-F", "-"]], input=message)
+            if result.returncode != 0:
+                spinner.fail("❌")
+                print(Fore.RED + f"❌ Commit failed: {result.stderr.strip() or result.stdout.strip()}")
+                return
+            spinner.ok("✅")
+        print(Fore.GREEN + "✅ All changes staged.")
+    else:
+        with spin("Committing changes...", "cyan") as spinner:
+            run_command(["git", "commit", "-F", "-"], capture_output=False, input=message)
+            spinner.ok("✅")
     print(Fore.GREEN + f"✅ Changes committed with message: '{message}'")
     send_notification("GitCLI", f"Commit successful: {message[:30]}...")
 
 def push_changes():
-    branch = get_current_branch()
+    checks = parallel_checks(remote=has_remote, state=repo_state)
+    state = checks["state"]
+    branch = state["branch"]
     config = get_config()
     
-    if not has_remote():
+    if not checks["remote"]:
         print(Fore.RED + "❌ No remote repository configured.")
         return
     
     # Check if there are uncommitted changes
-    if has_unstaged_changes() or has_staged_changes():
+    if state["staged"] or state["unstaged"]:
         print(Fore.YELLOW + "⚠️  You have uncommitted changes. Commit them first or use 'qp' for quick push.")
         return
     
+    # The tracking ref already says whether a plain push can succeed, so a
+    # diverged branch goes straight to the force-push prompt
+    if state["upstream"]:
+        if state["behind"] > 0 and state["ahead"] == 0:
+            print(Fore.YELLOW + f"⚠️  '{branch}' is {state['behind']} commit(s) behind the remote. Nothing to push.")
+            print(Fore.CYAN + "💡 Use 'pull' to merge remote changes.")
+            return
+        if state["behind"] > 0:
+            print(Fore.YELLOW + f"\n⚠️  Your branch is {state['behind']} commit(s) behind the remote branch.")
+            force_push(branch, config.get("confirm_force_push", True))
+            return
+        if state["ahead"] == 0:
+            print(Fore.GREEN + f"✅ '{branch}' is up to date with the remote. Nothing to push.")
+            return
+    
     # Now push (will push any commits that are ahead of remote)
-    with yaspin(text=f"Pushing branch '{branch}'...", color="magenta") as spinner:
-        result = subprocess.run("git push", shell=True, capture_output=True, text=True)
+    with spin(f"Pushing branch '{branch}'...", "magenta") as spinner:
+        result = run_process(["git", "push"])
         if result.returncode == 0:
             spinner.ok("🚀")
             print(Fore.GREEN + f"✅ Changes pushed to '{branch}'!")
             send_notification("GitCLI", f"Push to '{branch}' complete!")
         else:
             spinner.fail("❌")
-            if "rejected" in result.stderr and "non-fast-forward" in result.stderr:
-                print(Fore.YELLOW + "\n⚠️  Push rejected: Your branch is behind the remote branch.")
-                
-                # Check confirm_force_push config
-                if config.get("confirm_force_push", True):
-                    force = input(Fore.RED + "Do you want to force push and overwrite the remote? (yes/N): ").lower()
-                    if force != "yes":
-                        print(Fore.CYAN + "🚫 Force push canceled.")
-                        return
+    
+    if result.returncode == 0:
+        return
+    # The tracking ref can be stale, so a rejection is still possible
+    if push_rejected(result.stderr):
+        print(Fore.YELLOW + "\n⚠️  Push rejected: Your branch is behind the remote branch.")
+        force_push(branch, config.get("confirm_force_push", True))
+    elif "no upstream" in result.stderr:
+        print(Fore.YELLOW + "\n⚠️  No upstream branch set.")
+        setup = input("Set upstream and push? (Y/n): ").lower()
+        if setup != "n":
+            with spin("Setting upstream and pushing...", "magenta") as spinner:
+                result2 = run_command(["git", "push", "-u", "origin", branch], capture_output=False)
+                if result2 is not None:
+                    spinner.ok("🚀")
+                    print(Fore.GREEN + f"✅ Pushed to '{branch}' and set upstream!")
                 else:
-                    print(Fore.YELLOW + "⚠️  Force pushing (confirm_force_push is disabled)...")
-                
-                with yaspin(text=f"Force pushing to '{branch}'...", color="red") as spinner2:
-                    force_result = run_command("git push --force", capture_output=False)
-                    if force_result is not None:
-                        spinner2.ok("🚀")
-                        print(Fore.GREEN + f"✅ Force pushed to '{branch}'!")
-                        send_notification("GitCLI", f"Force push to '{branch}' complete!")
-                    else:
-                        spinner2.fail("❌")
-            elif "no upstream" in result.stderr:
-                print(Fore.YELLOW + "\n⚠️  No upstream branch set.")
-                setup = input("Set upstream and push? (Y/n): ").lower()
-                if setup != "n":
-                    with yaspin(text="Setting upstream and pushing...", color="magenta") as spinner2:
-                        result2 = run_command(f"git push -u origin {branch}", capture_output=False)
-                        if result2 is not None:
-                            spinner2.ok("🚀")
-                            print(Fore.GREEN + f"✅ Pushed to '{branch}' and set upstream!")
-                        else:
-                            spinner2.fail("❌")
-            else:
-                print(Fore.RED + f"❌ Push failed: {result.stderr.strip()}")
+                    spinner.fail("❌")
+    else:
+        print(Fore.RED + f"❌ Push failed: {result.stderr.strip()}")
+
+def push_rejected(stderr):
+    """Whether a push failed because the remote has commits we don't"""
+    return "rejected" in stderr and ("non-fast-forward" in stderr or "fetch first" in stderr)
+
+def force_push(branch, confirm=True):
+    """Force push the current branch, asking first if `confirm` is set"""
+    if confirm:
+        force = input(Fore.RED + "Do you want to force push and overwrite the remote? (yes/N): ").lower()
+        if force != "yes":
+            print(Fore.CYAN + "🚫 Force push canceled.")
+            return
+    else:
+        print(Fore.YELLOW + "⚠️  Force pushing (confirm_force_push is disabled)...")
+    
+    with spin(f"Force pushing to '{branch}'...", "red") as spinner:
+        force_result = run_command(["git", "push", "--force"], capture_output=False)
+        if force_result is not None:
+            spinner.ok("🚀")
+            print(Fore.GREEN + f"✅ Force pushed to '{branch}'!")
+            send_notification("GitCLI", f"Force push to '{branch}' complete!")
+        else:
+            spinner.fail("❌")
 
 def pull_changes():
-    branch = get_current_branch()
+    checks = parallel_checks(branch=get_current_branch, remote=has_remote)
+    branch = checks["branch"]
     
-    if not has_remote():
+    if not checks["remote"]:
         print(Fore.RED + "❌ No remote repository configured.")
         return
     
     print(Fore.CYAN + f"\n⬇️  Pulling latest changes for '{branch}'...")
-    with yaspin(text="Pulling...", color="cyan") as spinner:
-        result = run_command("git pull", capture_output=False)
+    with spin("Pulling...", "cyan") as spinner:
+        result = run_command(["git", "pull"], capture_output=False)
         if result is not None:
             spinner.ok("✅")
             print(Fore.GREEN + f"✅ Successfully pulled latest changes!")
@@ -284,7 +320,7 @@ def pull_changes():
 
 def stage_changes():
     """Stage changes with options"""
-    if not has_unstaged_changes():
+    if not repo_state()["unstaged"]:
         print(Fore.YELLOW + "⚠️  No unstaged changes to stage.")
         return
     
@@ -295,32 +331,28 @@ def stage_changes():
     choice = input("Choose option (1/2): ").strip()
     
     if choice == "1":
-        with yaspin(text="Staging all changes...", color="cyan") as spinner:
-            run_command("git add .", capture_output=False)
-            spinner.ok("✅")
+        run_command(["git", "add", "."], capture_output=False)
         print(Fore.GREEN + "✅ All changes staged.")
     elif choice == "2":
         print(Fore.CYAN + "\nUnstaged files:")
-        display_command("git diff --name-only")
+        display_command(["git", "diff", "--name-only"])
         print(Fore.CYAN + "\nEnter file paths (space-separated):")
         files = input("> ").strip()
         if not files:
             print(Fore.RED + "❌ No files specified.")
             return
-        with yaspin(text="Staging files...", color="cyan") as spinner:
-            run_command(f"git add {files}", capture_output=False)
-            spinner.ok("✅")
+        run_command(["git", "add", *shlex.split(files)], capture_output=False)
         print(Fore.GREEN + f"✅ Files staged: {files}")
     else:
         print(Fore.RED + "❌ Invalid option.")
 
 def show_status():
     print(Fore.CYAN + "\n📊 Git Status:\n" + "-"*30)
-    display_command("git status")
+    display_command(["git", "status"])
 
 def show_log():
     print(Fore.CYAN + "\n📜 Recent Commits:\n" + "-"*30)
-    display_command("git log --oneline --graph --decorate -10")
+    display_command(["git", "log", "--oneline", "--graph", "--decorate", "-10"])
 
 def show_diff():
     """Show unstaged changes"""
@@ -328,7 +360,7 @@ def show_diff():
         print(Fore.YELLOW + "⚠️  No unstaged changes to show.")
         return
     print(Fore.CYAN + "\n📝 Unstaged Changes:\n" + "-"*30)
-    display_command("git diff")
+    display_command(["git", "diff"])
 
 def show_diff_staged():
     """Show staged changes"""
@@ -336,47 +368,35 @@ def show_diff_staged():
         print(Fore.YELLOW + "⚠️  No staged changes to show.")
         return
     print(Fore.CYAN + "\n📝 Staged Changes:\n" + "-"*30)
-    display_command("git diff --cached")
+    display_command(["git", "diff", "--cached"])
 
 def sync_changes():
     """Pull then push changes"""
-    branch = get_current_branch()
+    checks = parallel_checks(remote=has_remote, state=repo_state)
+    branch = checks["state"]["branch"]
     
-    if not has_remote():
+    if not checks["remote"]:
         print(Fore.RED + "❌ No remote repository configured.")
         return
     
-    # Pull first
+    # Pull and push in a single shell invocation; push reports
+    # "Everything up-to-date" when the pull left nothing to send
     print(Fore.CYAN + f"\n🔄 Syncing '{branch}': Pull → Push")
-    with yaspin(text="Pulling latest changes...", color="cyan") as spinner:
-        result = subprocess.run("git pull", shell=True, capture_output=True, text=True)
+    with spin(f"Pulling and pushing '{branch}'...", "magenta") as spinner:
+        result = run_chain([["git", "pull"], ["git", "push"]])
         if result.returncode != 0:
             spinner.fail("❌")
-            print(Fore.RED + f"❌ Pull failed: {result.stderr.strip()}")
-            return
-        spinner.ok("✅")
-    print(Fore.GREEN + "✅ Pull complete.")
-    
-    # Check if there's anything to push
-    if not has_any_changes():
-        # Check if local is ahead of remote
-        ahead = run_command("git rev-list --count @{u}..HEAD")
-        if ahead and int(ahead) > 0:
-            print(Fore.CYAN + f"\n📤 Local branch is {ahead} commit(s) ahead. Pushing...")
-        else:
-            print(Fore.YELLOW + "⚠️  Already up to date. Nothing to push.")
+            step = "Push" if "failed to push" in result.stderr else "Pull"
+            print(Fore.RED + f"❌ {step} failed: {result.stderr.strip()}")
             return
+        spinner.ok("🚀")
     
-    # Push
-    with yaspin(text=f"Pushing to '{branch}'...", color="magenta") as spinner:
-        result = subprocess.run("git push", shell=True, capture_output=True, text=True)
-        if result.returncode == 0:
-            spinner.ok("🚀")
-            print(Fore.GREEN + f"✅ Sync complete!")
-            send_notification("GitCLI", f"Sync to '{branch}' complete!")
-        else:
-            spinner.fail("❌")
-            print(Fore.RED + f"❌ Push failed: {result.stderr.strip()}")
+    if "Everything up-to-date" in result.stderr:
+        print(Fore.GREEN + "✅ Pull complete.")
+        print(Fore.YELLOW + "⚠️  Already up to date. Nothing to push.")
+        return
+    print(Fore.GREEN + f"✅ Sync complete!")
+    send_notification("GitCLI", f"Sync to '{branch}' complete!")
 
 def fetch_changes():
     """Fetch updates from remote without merging"""
@@ -385,16 +405,15 @@ def fetch_changes():
         return
     
     print(Fore.CYAN + "\n📥 Fetching updates from remote...")
-    with yaspin(text="Fetching...", color="cyan") as spinner:
-        result = run_command("git fetch", capture_output=False)
+    with spin("Fetching...", "cyan") as spinner:
+        result = run_command(["git", "fetch"], capture_output=False)
         if result is not None:
             spinner.ok("✅")
             print(Fore.GREEN + "✅ Fetch complete.")
             
             # Show if branch is behind
-            branch = get_current_branch()
-            behind = run_command("git rev-list --count HEAD..@{u}")
-            if behind and int(behind) > 0:
+            behind = (ahead_behind() or (0, 0))[1]
+            if behind > 0:
                 print(Fore.YELLOW + f"⚠️  Your branch is {behind} commit(s) behind remote.")
                 print(Fore.CYAN + "💡 Use 'pull' to merge remote changes.")
         else:
@@ -410,13 +429,13 @@ def clone_repository():
     
     folder = input("Enter folder name (leave empty for default): ").strip()
     
-    cmd = f"git clone {url}"
+    cmd = ["git", "clone", "--", url]
     if folder:
-        cmd += f" {folder}"
+        cmd.append(folder)
     
     print(Fore.CYAN + f"\n⬇️  Cloning repository...")
-    with yaspin(text="Cloning...", color="cyan") as spinner:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    with spin("Cloning...", "cyan") as spinner:
+        result = run_process(cmd)
         if result.returncode == 0:
             spinner.ok("✅")
             print(Fore.GREEN + "✅ Repository cloned successfully!")
@@ -432,23 +451,20 @@ def clone_repository():
 
 def quick_push():
     """Stage all, commit, and push in one command"""
-    branch = get_current_branch()
+    checks = parallel_checks(remote=has_remote, state=repo_state)
+    state = checks["state"]
+    branch = state["branch"]
     
-    if not has_remote():
+    if not checks["remote"]:
         print(Fore.RED + "❌ No remote repository configured.")
         return
     
     # Check if there are any changes
-    if not has_any_changes():
+    if not (state["staged"] or state["unstaged"]):
         print(Fore.YELLOW + "⚠️  No changes to commit and push.")
         return
     
-    # Stage all changes
     print(Fore.CYAN + "\n🚀 Quick Push: Stage → Commit → Push")
-    with yaspin(text="Staging all changes...", color="cyan") as spinner:
-        run_command("git add .", capture_output=False)
-        spinner.ok("✅")
-    print(Fore.GREEN + "✅ All changes staged.")
     
     # Get commit message
     print(Fore.CYAN + "\n📝 Enter commit message:")
@@ -457,34 +473,33 @@ def quick_push():
         print(Fore.RED + "❌ Commit message cannot be empty. Quick push canceled.")
         return
     
-    # Commit
-    with yaspin(text="Committing changes...", color="cyan") as spinner:
-        run_command(f'git commit -m "{message}"', capture_output=False)
-        spinner.ok("✅")
-    print(Fore.GREEN + f"✅ Changes committed with message: '{message}'")
-    
-    # Push
-    with yaspin(text=f"Pushing to '{branch}'...", color="magenta") as spinner:
-        result = subprocess.run("git push", shell=True, capture_output=True, text=True)
+    # Stage, commit and push in a single shell invocation. If the branch is
+    # already behind its upstream the push can't succeed, so stop after the
+    # commit and go straight to the force-push prompt
+    diverged = bool(state["upstream"]) and state["behind"] > 0
+    steps = [["git", "add", "."], ["git", "commit", "-F", "-"]]
+    if not diverged:
+        steps.append(["git", "push"])
+    text = "Staging and committing..." if diverged else f"Staging, committing and pushing to '{branch}'..."
+    with spin(text, "magenta") as spinner:
+        result = run_chain(steps, input=message)
         if result.returncode == 0:
             spinner.ok("🚀")
-            print(Fore.GREEN + f"✅ Successfully pushed to '{branch}'!")
-            send_notification("GitCLI", f"Quick push to '{branch}' complete!")
         else:
             spinner.fail("❌")
-            if "rejected" in result.stderr and "non-fast-forward" in result.stderr:
-                print(Fore.YELLOW + "\n⚠️  Push rejected: Your branch is behind the remote branch.")
-                force = input(Fore.RED + "Do you want to force push and overwrite the remote? (yes/N): ").lower()
-                if force == "yes":
-                    with yaspin(text=f"Force pushing to '{branch}'...", color="red") as spinner2:
-                        force_result = run_command("git push --force", capture_output=False)
-                        if force_result is not None:
-                            spinner2.ok("🚀")
-                            print(Fore.GREEN + f"✅ Force pushed to '{branch}'!")
-                            send_notification("GitCLI", f"Force push to '{branch}' complete!")
-                        else:
-                            spinner2.fail("❌")
-                else:
-                    print(Fore.CYAN + "🚫 Force push canceled.")
-            else:
-                print(Fore.RED + f"❌ Push failed: {result.stderr.strip()}")
+    
+    rejected = push_rejected(result.stderr)
+    if result.returncode == 0 and not diverged:
+        print(Fore.GREEN + f"✅ Changes committed with message: '{message}'")
+        print(Fore.GREEN + f"✅ Successfully pushed to '{branch}'!")
+        send_notification("GitCLI", f"Quick push to '{branch}' complete!")
+    elif (result.returncode == 0 and diverged) or rejected:
+        print(Fore.GREEN + f"✅ Changes committed with message: '{message}'")
+        if rejected:
+            print(Fore.YELLOW + "\n⚠️  Push rejected: Your branch is behind the remote branch.")
+        else:
+            print(Fore.YELLOW + f"\n⚠️  Your branch is {state['behind']} commit(s) behind the remote branch.")
+        # quick push has always asked before forcing, whatever the config says
+        force_push(branch)
+    else:
+        print(Fore.RED + f"❌ Quick push failed: {result.stderr.strip() or result.stdout.strip()}")
@@ -1,8 +1,6 @@
 import os
-import subprocess
 from colorama import Fore
-from yaspin import yaspin
-from .helpers import run_command, display_command, has_any_changes
+from .helpers import run_command, run_process, display_command, has_any_changes, spin
 
 def stash_changes():
     """Stash uncommitted changes"""
@@ -14,11 +12,11 @@ def stash_changes():
     print(Fore.CYAN + "Enter stash message (optional, press Enter to skip):")
     message = input("> ").strip()
     
-    cmd = "git stash push"
+    cmd = ["git", "stash", "push"]
     if message:
-        cmd += f' -m "{message}"'
+        cmd += ["-m", message]
     
-    with yaspin(text="Stashing changes...", color="cyan") as spinner:
+    with spin("Stashing changes...", "cyan") as spinner:
         result = run_command(cmd, capture_output=False)
         if result is not None:
             spinner.ok("✅")
@@ -32,14 +30,14 @@ def stash_changes():
 def stash_pop():
     """Apply and remove the most recent stash"""
     # Check if there are stashes
-    stashes = run_command("git stash list")
+    stashes = run_command(["git", "stash", "list"])
     if not stashes:
         print(Fore.YELLOW + "⚠️  No stashes found.")
         return
     
     print(Fore.CYAN + "\n📤 Pop Stash (apply and remove)")
     print(Fore.CYAN + "\nAvailable stashes:")
-    display_command("git stash list")
+    display_command(["git", "stash", "list"])
     
     print(Fore.CYAN + "\nOptions:")
     print("  1. Pop most recent stash")
@@ -48,8 +46,8 @@ def stash_pop():
     choice = input("\nChoose option (1/2): ").strip()
     
     if choice == "1":
-        with yaspin(text="Popping stash...", color="cyan") as spinner:
-            result = subprocess.run("git stash pop", shell=True, capture_output=True, text=True)
+        with spin("Popping stash...", "cyan") as spinner:
+            result = run_process(["git", "stash", "pop"])
             if result.returncode == 0:
                 spinner.ok("✅")
                 print(Fore.GREEN + "✅ Stash applied and removed!")
@@ -67,8 +65,8 @@ def stash_pop():
             print(Fore.RED + "❌ Stash ID cannot be empty.")
             return
         
-        with yaspin(text=f"Popping {stash_id}...", color="cyan") as spinner:
-            result = subprocess.run(f"git stash pop {stash_id}", shell=True, capture_output=True, text=True)
+        with spin(f"Popping {stash_id}...", "cyan") as spinner:
+            result = run_process(["git", "stash", "pop", stash_id])
             if result.returncode == 0:
                 spinner.ok("✅")
                 print(Fore.GREEN + f"✅ Stash {stash_id} applied and removed!")
@@ -85,14 +83,14 @@ def stash_pop():
 def stash_apply():
     """Apply stash without removing it"""
     # Check if there are stashes
-    stashes = run_command("git stash list")
+    stashes = run_command(["git", "stash", "list"])
     if not stashes:
         print(Fore.YELLOW + "⚠️  No stashes found.")
         return
     
     print(Fore.CYAN + "\n📥 Apply Stash (keep in stash list)")
     print(Fore.CYAN + "\nAvailable stashes:")
-    display_command("git stash list")
+    display_command(["git", "stash", "list"])
     
     print(Fore.CYAN + "\nOptions:")
     print("  1. Apply most recent stash")
@@ -101,8 +99,8 @@ def stash_apply():
     choice = input("\nChoose option (1/2): ").strip()
     
     if choice == "1":
-        with yaspin(text="Applying stash...", color="cyan") as spinner:
-            result = subprocess.run("git stash apply", shell=True, capture_output=True, text=True)
+        with spin("Applying stash...", "cyan") as spinner:
+            result = run_process(["git", "stash", "apply"])
             if result.returncode == 0:
                 spinner.ok("✅")
                 print(Fore.GREEN + "✅ Stash applied successfully!")
@@ -121,8 +119,8 @@ def stash_apply():
             print(Fore.RED + "❌ Stash ID cannot be empty.")
             return
         
-        with yaspin(text=f"Applying {stash_id}...", color="cyan") as spinner:
-            result = subprocess.run(f"git stash apply {stash_id}", shell=True, capture_output=True, text=True)
+        with spin(f"Applying {stash_id}...", "cyan") as spinner:
+            result = run_process(["git", "stash", "apply", stash_id])
             if result.returncode == 0:
                 spinner.ok("✅")
                 print(Fore.GREEN + f"✅ Stash {stash_id} applied successfully!")
@@ -139,14 +137,14 @@ def stash_apply():
 
 def stash_list():
     """List all stashes"""
-    stashes = run_command("git stash list")
+    stashes = run_command(["git", "stash", "list"])
     
     if not stashes:
         print(Fore.YELLOW + "\n⚠️  No stashes found.")
         return
     
     print(Fore.CYAN + "\n📋 Stash List:\n" + "-"*60)
-    display_command("git stash list")
+    display_command(["git", "stash", "list"])
     print(Fore.CYAN + "-"*60)
     
     # Show details option
@@ -155,18 +153,18 @@ def stash_list():
         stash_id = input("Enter stash ID (e.g., stash@{0}): ").strip()
         if stash_id:
             print(Fore.CYAN + f"\n📄 Details for {stash_id}:\n" + "-"*60)
-            display_command(f"git stash show -p {stash_id}")
+            display_command(["git", "stash", "show", "-p", stash_id])
 
 def stash_drop():
     """Remove a stash"""
-    stashes = run_command("git stash list")
+    stashes = run_command(["git", "stash", "list"])
     if not stashes:
         print(Fore.YELLOW + "⚠️  No stashes found.")
         return
     
     print(Fore.CYAN + "\n🗑️  Drop Stash")
     print(Fore.CYAN + "\nAvailable stashes:")
-    display_command("git stash list")
+    display_command(["git", "stash", "list"])
     
     print(Fore.CYAN + "\nOptions:")
     print("  1. Drop most recent stash")
@@ -178,8 +176,8 @@ def stash_drop():
     if choice == "1":
         confirm = input(Fore.YELLOW + "Drop most recent stash? (y/N): ").lower()
         if confirm == "y":
-            with yaspin(text="Dropping stash...", color="yellow") as spinner:
-                result = run_command("git stash drop", capture_output=False)
+            with spin("Dropping stash...", "yellow") as spinner:
+                result = run_command(["git", "stash", "drop"], capture_output=False)
                 if result is not None:
                     spinner.ok("✅")
                     print(Fore.GREEN + "✅ Stash dropped!")
@@ -194,8 +192,8 @@ def stash_drop():
         
         confirm = input(Fore.YELLOW + f"Drop {stash_id}? (y/N): ").lower()
         if confirm == "y":
-            with yaspin(text=f"Dropping {stash_id}...", color="yellow") as spinner:
-                result = run_command(f"git stash drop {stash_id}", capture_output=False)
+            with spin(f"Dropping {stash_id}...", "yellow") as spinner:
+                result = run_command(["git", "stash", "drop", stash_id], capture_output=False)
                 if result is not None:
                     spinner.ok("✅")
                     print(Fore.GREEN + f"✅ Stash {stash_id} dropped!")
@@ -205,8 +203,8 @@ def stash_drop():
     elif choice == "3":
         confirm = input(Fore.RED + "Drop ALL stashes? This cannot be undone! (yes/N): ").lower()
         if confirm == "yes":
-            with yaspin(text="Dropping all stashes...", color="red") as spinner:
-                result = run_command("git stash clear", capture_output=False)
+            with spin("Dropping all stashes...", "red") as spinner:
+                result = run_command(["git", "stash", "clear"], capture_output=False)
                 if result is not None:
                     spinner.ok("✅")
                     print(Fore.GREEN + "✅ All stashes cleared!")
@@ -217,20 +215,20 @@ def stash_drop():
 
 def stash_show():
     """Show changes in a stash"""
-    stashes = run_command("git stash list")
+    stashes = run_command(["git", "stash", "list"])
     if not stashes:
         print(Fore.YELLOW + "⚠️  No stashes found.")
         return
     
     print(Fore.CYAN + "\n📄 Show Stash Contents")
     print(Fore.CYAN + "\nAvailable stashes:")
-    display_command("git stash list")
+    display_command(["git", "stash", "list"])
     
     stash_id = input("\nEnter stash ID (e.g., stash@{0}, or press Enter for most recent): ").strip()
     
-    cmd = "git stash show -p"
+    cmd = ["git", "stash", "show", "-p"]
     if stash_id:
-        cmd += f" {stash_id}"
+        cmd.append(stash_id)
     
     print(Fore.CYAN + f"\n📝 Stash Contents:\n" + "-"*60)
     display_command(cmd)
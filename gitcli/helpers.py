@@ -1,17 +1,304 @@
 import subprocess
 import os
-import platform
+import sys
 import json
+import atexit
+import shlex
+import shutil
+import stat
+import threading
+import time
 from colorama import Fore
 
 CONFIG_FILE = ".gitcli-config.json"
 
-def run_command(cmd, capture_output=True):
-    """Run a shell command safely and return output."""
+# Git subcommands that can move HEAD or rewrite refs; running one of these
+# through run_command invalidates the cached query results below.
+MUTATING_COMMANDS = frozenset({
+    "add", "branch", "checkout", "cherry-pick", "commit", "fetch", "init", "merge",
+    "pull", "push", "rebase", "remote", "reset", "revert", "rm", "stash", "switch",
+})
+
+# For these, only some sub-subcommands write: a bare `git remote` or
+# `git stash list` is a read-only query and must not invalidate anything
+_MUTATING_REMOTE = frozenset({
+    "add", "remove", "rm", "rename", "set-url", "set-head", "set-branches", "prune", "update",
+})
+_READONLY_STASH = frozenset({"list", "show"})
+
+def _is_mutating(cmd):
+    """Whether running `cmd` (argv list) may change the repository."""
+    if len(cmd) < 2 or cmd[0] != "git" or cmd[1] not in MUTATING_COMMANDS:
+        return False
+    if cmd[1] == "remote":
+        return len(cmd) > 2 and cmd[2] in _MUTATING_REMOTE
+    if cmd[1] == "stash":
+        return len(cmd) == 2 or cmd[2] not in _READONLY_STASH
+    return True
+
+_cache = {
+    "generation": 0,
+    "branch": None, "branch_key": None,
+    "state": None, "state_key": None,
+    "remote": None, "remote_key": None,
+    "repo": None,
+    "system": None,
+}
+
+# Filled in by probe_repo(); once the repository has been located, git calls
+# get GIT_DIR/GIT_WORK_TREE so git doesn't repeat its discovery walk
+_repo = {"probed": None, "git_dir": None, "common_dir": None, "toplevel": None, "env": None}
+
+# Commands that create a repository rather than operate on the current one
+_NO_REPO_ENV = frozenset({"clone", "init"})
+
+
+def _plausible_branch_name(name):
+    # Anything git would parse as revision syntax can't be a branch name
+    return bool(name) and not (
+        any(c in name for c in " ~^:?*[\\") or ".." in name or "@{" in name
+    )
+
+
+class GitSession:
+    """Long-running `git cat-file --batch-check` process for object lookups.
+
+    Resolving a revision through the open pipe costs a write and a readline
+    instead of a fresh fork/exec of git for every query.
+    """
+
+    def __init__(self):
+        self._proc = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch-check=%(objectname)"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True, bufsize=1, env=_repo["env"]
+        )
+
+    def resolve(self, rev):
+        """Return the object name `rev` points at, or None if it doesn't exist."""
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+            try:
+                self._proc.stdin.write(rev + "\n")
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline()
+            except OSError:
+                line = ""
+            if not line:
+                # git exits on revisions it can't parse (e.g. a missing @{u});
+                # the next lookup starts a fresh process
+                self._stop()
+                return None
+            line = line.strip()
+            return None if line.endswith(" missing") else line
+
+    def head_sha(self):
+        """Return the commit HEAD points at, or None before the first commit."""
+        return self.resolve("HEAD")
+
+    def branch_exists(self, name):
+        """Check whether a local branch called `name` exists."""
+        if not _plausible_branch_name(name):
+            return False
+        return self.resolve("refs/heads/" + name) is not None
+
+    def _stop(self):
+        if self._proc is not None:
+            try:
+                self._proc.stdin.close()
+            except OSError:
+                pass
+            self._proc.wait()
+            self._proc = None
+
+    def close(self):
+        with self._lock:
+            self._stop()
+
+
+_session = None
+
+def get_session():
+    """Return the shared GitSession, starting it on first use."""
+    global _session
+    if _session is None:
+        _session = GitSession()
+        atexit.register(_session.close)
+    return _session
+
+def close_session():
+    """Shut down the shared GitSession (when leaving the REPL)."""
+    if _session is not None:
+        _session.close()
+
+def _owned_by_us(path):
+    # git refuses repositories owned by someone else (safe.directory); leave
+    # those cases to git itself rather than bypassing the check via GIT_DIR
+    if not hasattr(os, "geteuid"):
+        return True
+    try:
+        return os.stat(path).st_uid == os.geteuid()
+    except OSError:
+        return False
+
+def _discover_repo(path):
+    """Walk up from `path` looking for `.git` the way git does, without spawning it.
+
+    Handles `.git` directories as well as gitfiles (submodules, linked
+    worktrees). Returns (git_dir, common_dir, toplevel), or None when no
+    repository is found or the layout is something only git can decide.
+    """
+    start = path
+    while True:
+        dotgit = os.path.join(path, ".git")
+        # One stat tells a .git directory from a gitfile from nothing at all
+        try:
+            mode = os.stat(dotgit).st_mode
+        except OSError:
+            mode = 0
+        if stat.S_ISDIR(mode):
+            git_dir = dotgit
+            break
+        if stat.S_ISREG(mode):
+            try:
+                with open(dotgit, encoding="utf-8") as f:
+                    line = f.readline().strip()
+            except OSError:
+                return None
+            if not line.startswith("gitdir: "):
+                return None
+            git_dir = os.path.normpath(os.path.join(path, line[8:]))
+            break
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+    if not os.path.isfile(os.path.join(git_dir, "HEAD")):
+        return None
+    if (start + os.sep).startswith(git_dir + os.sep):
+        return None  # inside the git dir itself, not a work tree
+    if not (_owned_by_us(path) and _owned_by_us(git_dir)):
+        return None
+    common_dir = git_dir
+    try:
+        with open(os.path.join(git_dir, "commondir"), encoding="utf-8") as f:
+            common_dir = os.path.normpath(os.path.join(git_dir, f.readline().strip()))
+    except OSError:
+        pass
+    return git_dir, common_dir, path
+
+def _rev_parse_repo():
+    result = subprocess.run(
+        ["git", "rev-parse", "--git-dir", "--git-common-dir", "--show-toplevel"],
+        capture_output=True, text=True
+    )
+    lines = result.stdout.splitlines()
+    if result.returncode != 0 or len(lines) != 3:
+        return None
+    return os.path.abspath(lines[0]), os.path.abspath(lines[1]), lines[2]
+
+def probe_repo(refresh=False):
+    """Locate the repository once and cache the result.
+
+    The directory walk in _discover_repo answers the common case without a
+    subprocess; anything unusual (GIT_DIR in the environment, bare repos,
+    foreign ownership) is left to a single `git rev-parse`. Returns
+    (git_dir, toplevel), or None when not inside a work tree. The result is
+    remembered for the directory it was probed from.
+    """
+    cwd = os.getcwd()
+    if refresh or _repo["probed"] != cwd:
+        found = None
+        if "GIT_DIR" not in os.environ and "GIT_WORK_TREE" not in os.environ:
+            found = _discover_repo(cwd)
+        if found is None:
+            found = _rev_parse_repo()
+        if found is not None:
+            # Linked worktrees keep HEAD in git_dir but share refs in common_dir
+            git_dir, common_dir, toplevel = found
+            env = dict(os.environ, GIT_DIR=git_dir, GIT_WORK_TREE=toplevel)
+        else:
+            git_dir = common_dir = toplevel = env = None
+        _repo.update(
+            probed=cwd, git_dir=git_dir, common_dir=common_dir, toplevel=toplevel, env=env
+        )
+    if _repo["git_dir"] is None:
+        return None
+    return _repo["git_dir"], _repo["toplevel"]
+
+def is_git_repo():
+    return probe_repo() is not None
+
+_packed = {"key": None, "heads": frozenset()}
+
+def _packed_heads(common_dir):
+    """Branch names listed in packed-refs, re-read only when the file changes."""
+    path = os.path.join(common_dir, "packed-refs")
+    try:
+        st = os.stat(path)
+    except OSError:
+        return frozenset()
+    key = (path, st.st_ino, st.st_mtime_ns, st.st_size)
+    if _packed["key"] != key:
+        heads = set()
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                if line[:1] in ("#", "^"):
+                    continue
+                ref = line.rstrip("\n").partition(" ")[2]
+                if ref.startswith("refs/heads/"):
+                    heads.add(ref[11:])
+        _packed.update(key=key, heads=frozenset(heads))
+    return _packed["heads"]
+
+def branch_exists(name):
+    """Check whether a local branch exists by looking at the ref files directly.
+
+    Falls back to the GitSession when the repo hasn't been probed or doesn't
+    use the files ref backend (e.g. reftable).
+    """
+    if not _plausible_branch_name(name):
+        return False
+    common_dir = _repo["common_dir"]
+    heads_dir = os.path.join(common_dir, "refs", "heads") if common_dir else None
+    if heads_dir is None or not os.path.isdir(heads_dir) or os.path.isfile(
+        os.path.join(common_dir, "reftable", "tables.list")
+    ):
+        return get_session().branch_exists(name)
+    if os.path.isfile(os.path.join(heads_dir, *name.split("/"))):
+        return True
+    return name in _packed_heads(common_dir)
+
+def _git_env(cmd):
+    """Environment for running `cmd`, or None to inherit the current one."""
+    if len(cmd) > 1 and cmd[0] == "git" and cmd[1] not in _NO_REPO_ENV:
+        return _repo["env"]
+    return None
+
+def bump_generation():
+    """Invalidate cached git query results after the repo may have changed."""
+    _cache["generation"] += 1
+
+def begin_command():
+    """Forget per-command results (working tree state) before a new command."""
+    _cache["state_key"] = None
+
+def run_command(cmd, capture_output=True, input=None):
+    """Run a command (argv list, no shell) and return output.
+
+    `input` is written to the command's stdin (e.g. a message for `git commit -F -`).
+    """
+    if _is_mutating(cmd):
+        bump_generation()
     try:
         result = subprocess.run(
-            cmd, shell=True, check=True,
-            capture_output=capture_output, text=True
+            cmd, check=True,
+            capture_output=capture_output, text=True, env=_git_env(cmd), input=input
         )
         return result.stdout.strip() if capture_output else ""
     except subprocess.CalledProcessError as e:
@@ -19,19 +306,148 @@ def run_command(cmd, capture_output=True):
             error_msg = e.stderr.strip() if e.stderr else str(e)
             print(Fore.RED + f"❌ Command failed: {error_msg}")
         return None
+    except OSError as e:
+        print(Fore.RED + f"❌ Command failed: {e}")
+        return None
+
+def system_name():
+    """Return platform.system(), importing platform on first use."""
+    if _cache["system"] is None:
+        import platform
+        _cache["system"] = platform.system()
+    return _cache["system"]
+
+class _NoSpinner:
+    """Stand-in for a yaspin spinner when spinners are turned off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def ok(self, text=""):
+        pass
+
+    def fail(self, text=""):
+        pass
+
+
+def spin(text, color):
+    """Return a yaspin spinner; yaspin is only imported once one is needed.
+
+    Spinners are skipped when stdout isn't a terminal (pipes, CI logs) or
+    GITCLI_NO_SPINNER is set.
+    """
+    if os.environ.get("GITCLI_NO_SPINNER") or not sys.stdout.isatty():
+        return _NoSpinner()
+    from yaspin import yaspin
+    return yaspin(text=text, color=color)
+
+_SPINNER_FRAMES = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+
+def run_spinning(cmd, text):
+    """Run a command (argv list), spinning only if it outlasts a short grace period.
+
+    The child is polled with a backoff (10ms at first, growing to 200ms), so
+    near-instant commands like `git init` return without a spinner thread or
+    any frames drawn. Returns the exit status, or None if it couldn't start.
+    """
+    if _is_mutating(cmd):
+        bump_generation()
+    try:
+        proc = subprocess.Popen(cmd, env=_git_env(cmd))
+    except OSError as e:
+        print(Fore.RED + f"❌ Command failed: {e}")
+        return None
+    draw = sys.stdout.isatty() and not os.environ.get("GITCLI_NO_SPINNER")
+    started = time.monotonic()
+    delay, frame, drawn = 0.01, 0, False
+    while proc.poll() is None:
+        time.sleep(delay)
+        elapsed = time.monotonic() - started
+        delay = 0.01 if elapsed < 0.1 else 0.05 if elapsed < 0.5 else min(delay * 2, 0.2)
+        if draw and elapsed >= 0.1:
+            sys.stdout.write(f"\r{_SPINNER_FRAMES[frame % len(_SPINNER_FRAMES)]} {text}")
+            sys.stdout.flush()
+            frame += 1
+            drawn = True
+    if drawn:
+        sys.stdout.write("\r\033[K")
+        sys.stdout.flush()
+    return proc.returncode
+
+def run_process(cmd):
+    """Run a command (argv list, no shell) and return the CompletedProcess.
+
+    For callers that need stderr or the exit status even on failure, such as
+    rejected pushes or stash conflicts.
+    """
+    if _is_mutating(cmd):
+        bump_generation()
+    try:
+        return subprocess.run(cmd, capture_output=True, text=True, env=_git_env(cmd))
+    except OSError as e:
+        return subprocess.CompletedProcess(cmd, 127, "", str(e))
+
+def _join_posix(argv):
+    return " ".join(shlex.quote(arg) for arg in argv)
+
+def run_chain(commands, input=None):
+    """Run several commands (argv lists) as one `&&` chain in a single shell.
+
+    `input` is fed to the chain's stdin, so a `git commit -F -` step can read
+    its message from it. Returns the CompletedProcess so callers can inspect
+    the combined output.
+    """
+    join = subprocess.list2cmdline if system_name() == "Windows" else _join_posix
+    bump_generation()
+    script = " && ".join(join(argv) for argv in commands)
+    return subprocess.run(
+        script, shell=True, capture_output=True, text=True, env=_repo["env"], input=input
+    )
 
 def display_command(cmd):
-    """Run a command and display output directly (for status, log, diff, etc.)"""
-    subprocess.run(cmd, shell=True)
+    """Run a command (argv list) and display output directly (for status, log, diff, etc.)
+
+    Output streams straight to the terminal (and git's pager) as it is
+    produced. Ctrl-C stops the command without leaving the REPL. Returns the
+    exit status so callers can detect failures.
+    """
+    try:
+        proc = subprocess.Popen(cmd, env=_git_env(cmd))
+    except OSError as e:
+        print(Fore.RED + f"❌ Command failed: {e}")
+        return 1
+    try:
+        return proc.wait()
+    except KeyboardInterrupt:
+        if proc.poll() is None:
+            proc.terminate()
+        proc.wait()
+        print()
+        return 130
+
+def _applescript_string(text):
+    """Quote text as an AppleScript string literal."""
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+def _spawn_detached(argv):
+    """Start a helper process without waiting for it to finish."""
+    subprocess.Popen(
+        argv, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL, start_new_session=True
+    )
 
 def send_notification(title, message):
     """Send system notification (cross-platform)."""
     try:
-        system = platform.system()
+        system = system_name()
         if system == "Darwin":  # macOS
-            os.system(f'''osascript -e 'display notification "{message}" with title "{title}"' ''')
+            script = f"display notification {_applescript_string(message)} with title {_applescript_string(title)}"
+            _spawn_detached(["osascript", "-e", script])
         elif system == "Linux":
-            os.system(f'notify-send "{title}" "{message}"')
+            _spawn_detached(["notify-send", title, message])
         elif system == "Windows":
             try:
                 from win10toast import ToastNotifier
@@ -42,30 +458,209 @@ def send_notification(title, message):
     except:
         pass
 
+def _branch_key():
+    """Token that changes whenever the current branch may have changed.
+
+    git rewrites HEAD through a lock file and rename on every checkout or
+    rename, so its inode and mtime are enough once the git dir is known;
+    otherwise fall back to the mutation generation.
+    """
+    if _repo["git_dir"] is not None:
+        try:
+            st = os.stat(os.path.join(_repo["git_dir"], "HEAD"))
+            return st.st_ino, st.st_mtime_ns
+        except OSError:
+            pass
+    return _cache["generation"]
+
+def _head_branch():
+    """Read the branch name straight from HEAD under the probed git dir.
+
+    Returns None when that isn't possible (not probed yet, reftable's
+    placeholder HEAD), so the caller can ask git instead.
+    """
+    if _repo["git_dir"] is None:
+        return None
+    try:
+        with open(os.path.join(_repo["git_dir"], "HEAD"), encoding="utf-8") as f:
+            head = f.readline().strip()
+    except OSError:
+        return None
+    if not head.startswith("ref: "):
+        return "HEAD"  # detached, as `rev-parse --abbrev-ref HEAD` reports it
+    ref = head[5:]
+    if not ref.startswith("refs/heads/") or ref == "refs/heads/.invalid":
+        return None
+    return ref[11:]
+
 def get_current_branch():
-    branch = run_command("git rev-parse --abbrev-ref HEAD")
-    return branch if branch else "main"
+    key = _branch_key()
+    if _cache["branch_key"] != key:
+        branch = _head_branch()
+        if branch is None:
+            branch = run_command(["git", "rev-parse", "--abbrev-ref", "HEAD"])
+        _cache["branch"] = branch if branch else "main"
+        _cache["branch_key"] = key
+    return _cache["branch"]
 
 def get_repo_name():
-    return os.path.basename(os.getcwd())
+    # Name the repository after its top-level directory, so running from a
+    # subdirectory still shows the repo; the cwd doesn't change mid-session
+    if _cache["repo"] is None:
+        repo = probe_repo()
+        _cache["repo"] = os.path.basename(repo[1] if repo else os.getcwd())
+    return _cache["repo"]
+
+def _state_key():
+    """Token for the cached repo_state(): the mutation generation plus the index's stat.
+
+    Anything that stages, commits or checks out rewrites .git/index, so this
+    also catches changes made outside run_command (hooks, formatters, other
+    terminals).
+    """
+    if _repo["git_dir"] is not None:
+        try:
+            st = os.stat(os.path.join(_repo["git_dir"], "index"))
+            return _cache["generation"], st.st_ino, st.st_mtime_ns, st.st_size
+        except OSError:
+            pass
+    return _cache["generation"]
+
+def repo_state():
+    """Return the working tree and branch state from a single `git status` call.
+
+    The dict has `staged`/`unstaged` (tracked files only), the `conflicted`
+    (unmerged) paths, `branch`, `upstream` and the `ahead`/`behind` counts
+    against it. The result is
+    memoized until the next mutating git command or the next top-level command.
+    """
+    if _cache["state_key"] != _state_key():
+        branch_key = _branch_key()
+        result = subprocess.run(
+            ["git", "status", "--porcelain=v2", "--branch", "-z", "--untracked-files=no"],
+            capture_output=True, text=True, env=_repo["env"]
+        )
+        state = {
+            "staged": False, "unstaged": False, "conflicted": [],
+            "branch": "main", "upstream": None, "ahead": 0, "behind": 0,
+        }
+        entries = iter(result.stdout.split("\0") if result.returncode == 0 else [])
+        for entry in entries:
+            if entry.startswith("# branch.head "):
+                head = entry[14:]
+                state["branch"] = "HEAD" if head == "(detached)" else head
+            elif entry.startswith("# branch.upstream "):
+                state["upstream"] = entry[18:]
+            elif entry.startswith("# branch.ab "):
+                ahead, behind = entry[12:].split()
+                state["ahead"], state["behind"] = int(ahead), -int(behind)
+            elif entry[:2] in ("1 ", "2 ", "u "):
+                x, y = entry[2], entry[3]
+                if entry[0] == "2":
+                    next(entries, None)  # renames/copies are followed by the source path
+                elif entry[0] == "u":
+                    state["conflicted"].append(entry.split(" ", 10)[10])
+                if x != ".":
+                    state["staged"] = True
+                if y != ".":
+                    state["unstaged"] = True
+        _cache["state"] = state
+        # git status may refresh the index, so take the key afterwards
+        _cache["state_key"] = _state_key()
+        if result.returncode == 0:
+            _cache["branch"] = state["branch"]
+            _cache["branch_key"] = branch_key
+    return _cache["state"]
+
+def _diff_quiet(*args):
+    # `git diff --quiet` stops at the first difference and prints nothing
+    result = subprocess.run(
+        ["git", "diff", "--quiet", *args],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=_repo["env"]
+    )
+    return result.returncode == 1
 
 def has_staged_changes():
-    status = run_command("git diff --cached --name-only")
-    return bool(status.strip())
+    # Reuse this command's status if it has been read; otherwise a single
+    # yes/no question is cheaper to ask git directly
+    if _cache["state_key"] == _state_key():
+        return _cache["state"]["staged"]
+    return _diff_quiet("--cached")
 
 def has_unstaged_changes():
-    status = run_command("git diff --name-only")
-    return bool(status.strip())
+    if _cache["state_key"] == _state_key():
+        return _cache["state"]["unstaged"]
+    return _diff_quiet()
 
 def has_any_changes():
-    return has_staged_changes() or has_unstaged_changes()
+    state = repo_state()
+    return state["staged"] or state["unstaged"]
+
+_SANITIZE_TABLE = str.maketrans({" ": "-"})
 
 def sanitize_name(name):
-    return name.strip().replace(" ", "-")
+    return name.strip().translate(_SANITIZE_TABLE)
+
+def parallel_checks(**calls):
+    """Run independent read-only queries concurrently.
+
+    Each keyword maps a name to a zero-argument callable; returns a dict of
+    the same names mapped to their results.
+    """
+    # concurrent.futures pulls in logging; only pay for it when used
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=len(calls) or 1) as pool:
+        futures = {name: pool.submit(call) for name, call in calls.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+def has_upstream():
+    """Check whether the current branch tracks a remote branch."""
+    return get_session().resolve("@{u}") is not None
+
+def ahead_behind():
+    """Return (ahead, behind) commit counts against the upstream, or None without one.
+
+    HEAD and @{u} are resolved through the GitSession first, so the common
+    in-sync case costs no extra git process.
+    """
+    session = get_session()
+    upstream = session.resolve("@{u}")
+    if upstream is None:
+        return None
+    if upstream == session.head_sha():
+        return 0, 0
+    counts = run_command(["git", "rev-list", "--left-right", "--count", "HEAD...@{u}"])
+    if not counts:
+        return None
+    ahead, behind = counts.split()
+    return int(ahead), int(behind)
+
+def _remote_key():
+    """Token for the cached has_remote(): the mutation generation plus the repo config's stat.
+
+    Remotes live in the shared config file, which `git remote add/remove`
+    (or an edit from another terminal) rewrites.
+    """
+    if _repo["common_dir"] is not None:
+        try:
+            st = os.stat(os.path.join(_repo["common_dir"], "config"))
+            return _cache["generation"], st.st_ino, st.st_mtime_ns, st.st_size
+        except OSError:
+            pass
+    return _cache["generation"]
 
 def has_remote():
-    remote = run_command("git remote")
-    return bool(remote)
+    # Every save/push/pull asks this, and the answer rarely changes
+    if _cache["remote_key"] != _remote_key():
+        # Listed directly like repo_state, since this is a query and must
+        # not count as a mutation
+        result = subprocess.run(
+            ["git", "remote"], capture_output=True, text=True, env=_repo["env"]
+        )
+        _cache["remote"] = result.returncode == 0 and bool(result.stdout.strip())
+        # Taken afterwards, as repo_state does, so the stored key is current
+        _cache["remote_key"] = _remote_key()
+    return _cache["remote"]
 
 def get_config():
     """Load GitCLI configuration"""
@@ -100,7 +695,7 @@ def save_config(config):
 
 def get_commit_history_pattern():
     """Analyze last 5 commits to learn user's pattern"""
-    result = run_command("git log -5 --pretty=format:%s")
+    result = run_command(["git", "log", "-5", "--pretty=format:%s"])
     if not result:
         return None
     
@@ -127,7 +722,7 @@ def get_commit_history_pattern():
 def generate_commit_message():
     """Generate smart commit message based on changes"""
     # Get changed files
-    staged_files = run_command("git diff --cached --name-only")
+    staged_files = run_command(["git", "diff", "--cached", "--name-only"])
     if not staged_files:
         return "Update files"
     
@@ -169,10 +764,30 @@ def generate_commit_message():
             return f"Update {file_count} files"
 
 
+def unmerged_paths():
+    """Return the conflicted paths, relative to the top level.
+
+    Reuses this command's status if it has been read; otherwise asks the
+    index directly with `git ls-files -u`, which doesn't scan the work tree.
+    """
+    if _cache["state_key"] == _state_key():
+        return _cache["state"]["conflicted"]
+    result = subprocess.run(
+        ["git", "ls-files", "-u", "-z", "--full-name", "--", ":/"],
+        capture_output=True, text=True, env=_repo["env"]
+    )
+    paths = []
+    if result.returncode == 0:
+        # "<mode> <object> <stage>\t<path>", one entry per stage
+        for entry in result.stdout.split("\0"):
+            path = entry.partition("\t")[2]
+            if path and (not paths or paths[-1] != path):
+                paths.append(path)
+    return paths
+
 def check_for_conflicts():
     """Check if there are merge conflicts in working directory"""
-    result = run_command("git diff --name-only --diff-filter=U")
-    return bool(result and result.strip())
+    return bool(unmerged_paths())
 
 
 def validate_changes(validation_rules=None):
@@ -187,7 +802,7 @@ def validate_changes(validation_rules=None):
     issues = []
     
     # Get all changed files (both staged and unstaged)
-    changed_files = run_command("git diff --name-only HEAD")
+    changed_files = run_command(["git", "diff", "--name-only", "HEAD"])
     if not changed_files:
         return True, []
     
@@ -258,7 +873,7 @@ def check_large_files(max_size_mb=None):
         max_size_mb = config.get("validation_rules", {}).get("max_file_size_mb", 10)
     
     large_files = []
-    changed_files = run_command("git diff --name-only HEAD")
+    changed_files = run_command(["git", "diff", "--name-only", "HEAD"])
     
     if not changed_files:
         return []
@@ -278,21 +893,24 @@ def run_formatter():
     """Run code formatter if available"""
     # Check for common formatters
     formatters = {
-        'black': 'black .',
-        'prettier': 'prettier --write .',
-        'rustfmt': 'cargo fmt',
-        'gofmt': 'gofmt -w .',
+        'black': ['black', '.'],
+        'prettier': ['prettier', '--write', '.'],
+        'rustfmt': ['cargo', 'fmt'],
+        'gofmt': ['gofmt', '-w', '.'],
     }
     
     formatted = False
     for formatter, command in formatters.items():
-        # Check if formatter is available
-        check_cmd = f"command -v {formatter}"
-        result = subprocess.run(check_cmd, shell=True, capture_output=True)
-        if result.returncode == 0:
+        # Check if formatter is available (a PATH lookup, no shell needed)
+        if shutil.which(formatter):
             print(Fore.CYAN + f"  → Running {formatter}...")
-            result = subprocess.run(command, shell=True, capture_output=True, text=True)
+            try:
+                result = subprocess.run(command, capture_output=True, text=True)
+            except OSError:
+                continue
             if result.returncode == 0:
                 formatted = True
     
+    if formatted:
+        bump_generation()  # formatters rewrite files behind git's back
     return formatted
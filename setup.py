@@ -36,6 +36,7 @@ setup(
     ],
     extras_require={
         "windows": ["win10toast>=0.9"],
+        "fast": ["orjson>=3.0"],
     },
     entry_points={
         "console_scripts": [